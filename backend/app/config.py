@@ -1,4 +1,5 @@
 """Application configuration loaded from environment variables."""
+from functools import cache
 from pathlib import Path
 from typing import Literal
 
@@ -109,5 +110,18 @@ class Settings(BaseSettings):
             )
 
 
+@cache
+def get_default_settings() -> Settings:
+    """Get settings built from defaults and the environment, ignoring .env.
+
+    The instance is constructed once and cached; callers needing overrides
+    should construct Settings directly.
+
+    Returns:
+        Cached Settings instance with no environment file applied.
+    """
+    return Settings(_env_file=None)  # type: ignore[call-arg]
+
+
 # Global settings instance
 settings = Settings()
@@ -1,11 +1,29 @@
 """JSON logging setup for the application."""
+import atexit
 import logging
+import os
 import sys
 from pathlib import Path
+from typing import Any
 
+import orjson
 from pythonjsonlogger import jsonlogger
 
 from app.config import settings
+from app.util.time import utc_now_iso
+
+# Raw log file descriptor, level and console handler used by fast_emit;
+# set by setup_logging
+_fast_fd: int | None = None
+_fast_level = logging.INFO
+_fast_console: logging.Handler | None = None
+
+# Keys fast_emit fields may not use: the line's own layout plus LogRecord
+# attributes, mirroring the check in logging.Logger.makeRecord
+_FAST_RESERVED = frozenset(
+    {"ts", "level", "event", "message", "asctime"}
+    | logging.LogRecord("", 0, "", 0, "", None, None).__dict__.keys()
+)
 
 
 class CustomJsonFormatter(jsonlogger.JsonFormatter):
@@ -39,6 +57,24 @@ class CustomJsonFormatter(jsonlogger.JsonFormatter):
         if record.exc_info:
             log_record["exception"] = self.formatException(record.exc_info)
 
+    def jsonify_log_record(self, log_record: dict[str, Any]) -> str:
+        """Serialize the log record with orjson.
+
+        Values orjson cannot encode natively are written with str(). Records
+        orjson rejects outright (e.g. non-string keys) fall back to the
+        stdlib serializer.
+
+        Args:
+            log_record: The dictionary built by add_fields.
+
+        Returns:
+            The log record as a JSON string.
+        """
+        try:
+            return orjson.dumps(log_record, default=str).decode()
+        except TypeError:
+            return str(super().jsonify_log_record(log_record))  # type: ignore[no-untyped-call]
+
 
 def setup_logging() -> None:
     """Configure JSON logging to file and console.
@@ -83,6 +119,67 @@ def setup_logging() -> None:
     # Suppress noisy loggers
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
 
+    # Raw append descriptor for fast_emit, reopened if logging is set up again
+    global _fast_fd, _fast_level, _fast_console
+    close_fast_log()
+    _fast_console = console_handler
+    _fast_fd = os.open(
+        settings.LOG_FILE,
+        os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0),
+        0o644,
+    )
+    _fast_level = getattr(logging, settings.LOG_LEVEL)
+
+
+def fast_emit(event: str, message: str, level: int = logging.DEBUG, **fields: Any) -> None:
+    """Append a JSON log line directly to the log file.
+
+    Bypasses the logging module's record, formatter and handler chain for
+    per-message hot paths. Lines use the same ts/level/event/message layout
+    as CustomJsonFormatter and are echoed to the console handler like any
+    other entry. Does nothing until setup_logging has run or when level is
+    below LOG_LEVEL.
+
+    Args:
+        event: Event name, typically the calling module's __name__.
+        message: Log message.
+        level: Logging level of the entry.
+        **fields: Extra fields to include in the entry.
+
+    Raises:
+        KeyError: If a field would overwrite the entry's layout or a
+            LogRecord attribute.
+    """
+    if _fast_fd is None or level < _fast_level:
+        return
+    if not _FAST_RESERVED.isdisjoint(fields):
+        clash = sorted(_FAST_RESERVED.intersection(fields))
+        raise KeyError(f"Attempt to overwrite {clash!r} in fast_emit entry")
+    entry = {
+        "ts": utc_now_iso(),
+        "level": logging.getLevelName(level),
+        "event": event,
+        "message": message,
+        **fields,
+    }
+    os.write(_fast_fd, orjson.dumps(entry, default=str, option=orjson.OPT_APPEND_NEWLINE))
+    if _fast_console is not None:
+        record = logging.LogRecord(event, level, "", 0, message, None, None)
+        record.__dict__.update(fields)
+        _fast_console.handle(record)
+
+
+def close_fast_log() -> None:
+    """Close the descriptor used by fast_emit, if open.
+
+    Called on application shutdown and at interpreter exit; fast_emit
+    does nothing afterwards until setup_logging runs again.
+    """
+    global _fast_fd
+    if _fast_fd is not None:
+        os.close(_fast_fd)
+        _fast_fd = None
+
 
 def get_logger(name: str) -> logging.Logger:
     """Get a logger with the given name.
@@ -94,3 +191,6 @@ def get_logger(name: str) -> logging.Logger:
         A logging.Logger instance configured with the application's settings.
     """
     return logging.getLogger(name)
+
+
+atexit.register(close_fast_log)
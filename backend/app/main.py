@@ -4,11 +4,14 @@ from pathlib import Path
 from typing import AsyncGenerator
 
 from fastapi import FastAPI, Request
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from app.config import settings
-from app.logging_setup import setup_logging, get_logger
+from app.logging_setup import close_fast_log, setup_logging, get_logger
+from app.persistence.index_store import index_store
+from app.persistence.meta_store import meta_store
+from app.persistence.transcript_store import transcript_store
 from app.sessions.manager import session_manager
 from app.ws.router import router as ws_router
 
@@ -50,6 +53,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Shutdown
     logger.info("Application shutting down")
     await session_manager.shutdown()
+    meta_store.flush()
+    index_store.flush()
+    transcript_store.close()
+    close_fast_log()
 
 
 app = FastAPI(
@@ -57,6 +64,7 @@ app = FastAPI(
     description="Browser-based terminal UI for GitHub Copilot CLI",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
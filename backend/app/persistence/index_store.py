@@ -1,5 +1,7 @@
 """Index store for managing session index.json."""
-import json
+import asyncio
+import atexit
+import bisect
 from pathlib import Path
 from typing import Any
 
@@ -9,18 +11,42 @@ from app.util.time import utc_now_iso
 from app.ws.protocol import SessionIndexEntry
 
 
+def _created_at(entry: dict[str, Any]) -> str:
+    """Sort key for index entries.
+
+    Args:
+        entry: Session entry from the index
+
+    Returns:
+        The entry's createdAt timestamp
+    """
+    return str(entry["createdAt"])
+
+
 class IndexStore:
     """Manages the sessions index.json file."""
 
     PROTOCOL_VERSION = 1
 
-    def __init__(self, index_path: Path | None = None) -> None:
+    def __init__(
+        self, index_path: Path | None = None, flush_delay: float = 0.05
+    ) -> None:
         """Initialize the index store.
 
         Args:
             index_path: Optional custom path for index.json (for testing)
+            flush_delay: Seconds to coalesce mutations before writing when
+                called from a running event loop
         """
         self._index_path = index_path or get_index_path()
+        self._flush_delay = flush_delay
+        # Parsed index plus the (mtime_ns, size) of the file it came from
+        self._cache: dict[str, Any] | None = None
+        self._cache_key: tuple[int, int] | None = None
+        # Unsaved mutations in _cache and the timer that will write them
+        self._dirty = False
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_loop: asyncio.AbstractEventLoop | None = None
 
     @property
     def index_path(self) -> Path:
@@ -35,18 +61,46 @@ class IndexStore:
             "sessions": [],
         }
 
+    def _stat_key(self) -> tuple[int, int] | None:
+        """Get the cache key for the index file's current state.
+
+        Returns:
+            Tuple of (mtime_ns, size), or None if the file doesn't exist
+        """
+        try:
+            st = self._index_path.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
     def load(self) -> dict[str, Any]:
         """Load the index from disk.
 
+        The parsed index is cached and reused until the file's mtime or
+        size changes; pending unflushed mutations are always returned.
+        Sessions are kept sorted by createdAt ascending.
+
         Returns:
             Index data dictionary
 
-        Creates empty index if file doesn't exist.
+        Creates empty index if file doesn't exist or is empty.
         """
+        if self._dirty and self._cache is not None:
+            return self._cache
+        key = self._stat_key()
+        # Missing, or empty (e.g. created but never written): nothing to map
+        if key is None or key[1] == 0:
+            return self._get_empty_index()
+        if self._cache is not None and key == self._cache_key:
+            return self._cache
         try:
-            return read_json_file(self._index_path)
+            index: dict[str, Any] = read_json_file(self._index_path)
         except FileNotFoundError:
             return self._get_empty_index()
+        # Normally already in order, which makes this a linear pass
+        index["sessions"].sort(key=_created_at)
+        self._cache, self._cache_key = index, key
+        return index
 
     def save(self, index: dict[str, Any]) -> None:
         """Save the index to disk atomically.
@@ -54,8 +108,59 @@ class IndexStore:
         Args:
             index: Index data to save
         """
+        self._cancel_flush()
         index["updatedAt"] = utc_now_iso()
-        atomic_write_json(self._index_path, index)
+        try:
+            # Rewritten on every session change; compact output keeps it cheap
+            atomic_write_json(self._index_path, index, indent=False)
+        except Exception:
+            # Keep the unwritten mutations pending for the next flush
+            self._cache = index
+            self._dirty = True
+            raise
+        self._cache, self._cache_key = index, self._stat_key()
+        self._dirty = False
+
+    def flush(self) -> None:
+        """Write any pending mutations to disk immediately."""
+        if self._dirty and self._cache is not None:
+            self.save(self._cache)
+
+    def _cancel_flush(self) -> None:
+        """Cancel a scheduled flush, if any."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+            self._flush_loop = None
+
+    def _mark_dirty(self, index: dict[str, Any]) -> None:
+        """Record a mutated index and schedule it to be written.
+
+        Inside a running event loop, mutations within flush_delay of each
+        other are coalesced into a single write. Without a loop the index
+        is written immediately.
+
+        Args:
+            index: Mutated index data
+        """
+        self._cache = index
+        self._dirty = True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+        if self._flush_handle is not None and self._flush_loop is loop:
+            return
+        self._cancel_flush()
+        self._flush_loop = loop
+        self._flush_handle = loop.call_later(self._flush_delay, self._on_flush_timer)
+
+    def _on_flush_timer(self) -> None:
+        """Flush pending mutations when the debounce timer fires."""
+        self._flush_handle = None
+        self._flush_loop = None
+        self.flush()
 
     def add_session(
         self,
@@ -82,8 +187,8 @@ class IndexStore:
             "lastActivityAt": last_activity_at,
             "name": name,
         }
-        index["sessions"].append(entry)
-        self.save(index)
+        bisect.insort(index["sessions"], entry, key=_created_at)
+        self._mark_dirty(index)
 
     def update_session_status(
         self,
@@ -105,7 +210,7 @@ class IndexStore:
                 if last_activity_at:
                     session["lastActivityAt"] = last_activity_at
                 break
-        self.save(index)
+        self._mark_dirty(index)
 
     def update_session_name(
         self,
@@ -125,7 +230,7 @@ class IndexStore:
         for session in index["sessions"]:
             if session["sessionId"] == session_id:
                 session["name"] = name
-                self.save(index)
+                self._mark_dirty(index)
                 return True
         return False
 
@@ -136,10 +241,8 @@ class IndexStore:
             List of session index entries, sorted by createdAt descending
         """
         index = self.load()
-        sessions = [SessionIndexEntry(**s) for s in index["sessions"]]
-        # Sort by createdAt descending
-        sessions.sort(key=lambda s: s.createdAt, reverse=True)
-        return sessions
+        # Stored ascending by createdAt, so no sort is needed here
+        return [SessionIndexEntry(**s) for s in reversed(index["sessions"])]
 
     def get_session(self, session_id: str) -> SessionIndexEntry | None:
         """Get a specific session from the index.
@@ -166,8 +269,9 @@ class IndexStore:
         index["sessions"] = [
             s for s in index["sessions"] if s["sessionId"] != session_id
         ]
-        self.save(index)
+        self._mark_dirty(index)
 
 
 # Global index store instance
 index_store = IndexStore()
+atexit.register(index_store.flush)
@@ -1,16 +1,25 @@
 """Meta store for managing session meta.json files."""
+import asyncio
+import atexit
+from dataclasses import asdict, dataclass, fields, replace
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel
-
+from app.logging_setup import get_logger
 from app.util.atomic_write import atomic_write_json, read_json_file
 from app.util.paths import get_meta_path
 from app.util.time import utc_now_iso
 
+logger = get_logger(__name__)
+
 
-class SessionMeta(BaseModel):
-    """Session metadata model."""
+@dataclass(slots=True, kw_only=True)
+class SessionMeta:
+    """Session metadata record.
+
+    A slotted dataclass rather than a Pydantic model: it is only ever built
+    by this store from trusted data, so it needs no validation.
+    """
 
     sessionId: str
     status: str  # "running" | "exited"
@@ -25,16 +34,29 @@ class SessionMeta(BaseModel):
     error: dict[str, str] | None = None
 
 
+# Keys SessionMeta accepts; others (e.g. from another version) are ignored
+_META_FIELDS = frozenset(f.name for f in fields(SessionMeta))
+
+
 class MetaStore:
     """Manages session meta.json files."""
 
-    def __init__(self, base_path: Path | None = None) -> None:
+    def __init__(self, base_path: Path | None = None, activity_flush_delay: float = 1.0) -> None:
         """Initialize the meta store.
 
         Args:
             base_path: Optional base path for sessions (for testing)
+            activity_flush_delay: Seconds to coalesce activity updates before
+                writing when called from a running event loop
         """
         self._base_path = base_path
+        self._activity_flush_delay = activity_flush_delay
+        # Latest metadata per session; this store is the only writer
+        self._cache: dict[str, SessionMeta] = {}
+        # Sessions whose cached activity timestamp is not yet on disk
+        self._dirty: set[str] = set()
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_loop: asyncio.AbstractEventLoop | None = None
 
     def _get_meta_path(self, session_id: str) -> Path:
         """Get the meta.json path for a session.
@@ -49,21 +71,38 @@ class MetaStore:
             return self._base_path / session_id / "meta.json"
         return get_meta_path(session_id)
 
-    def load(self, session_id: str) -> SessionMeta | None:
-        """Load session metadata from disk.
+    def _get(self, session_id: str) -> SessionMeta | None:
+        """Get the store's own metadata instance, reading disk on a cache miss.
 
         Args:
             session_id: Session UUID
 
         Returns:
-            SessionMeta or None if not found
+            Cached SessionMeta or None if not found
         """
+        meta = self._cache.get(session_id)
+        if meta is not None:
+            return meta
         meta_path = self._get_meta_path(session_id)
         try:
             data = read_json_file(meta_path)
-            return SessionMeta(**data)
         except FileNotFoundError:
             return None
+        meta = SessionMeta(**{k: v for k, v in data.items() if k in _META_FIELDS})
+        self._cache[session_id] = meta
+        return meta
+
+    def load(self, session_id: str) -> SessionMeta | None:
+        """Load session metadata.
+
+        Args:
+            session_id: Session UUID
+
+        Returns:
+            SessionMeta or None if not found
+        """
+        meta = self._get(session_id)
+        return replace(meta) if meta is not None else None
 
     def save(self, meta: SessionMeta) -> None:
         """Save session metadata to disk atomically.
@@ -72,7 +111,56 @@ class MetaStore:
             meta: Session metadata to save
         """
         meta_path = self._get_meta_path(meta.sessionId)
-        atomic_write_json(meta_path, meta.model_dump())
+        atomic_write_json(meta_path, asdict(meta), indent=False)
+        self._cache[meta.sessionId] = replace(meta)
+        self._dirty.discard(meta.sessionId)
+
+    def flush(self) -> None:
+        """Write any pending activity updates to disk immediately."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+            self._flush_loop = None
+        failed = False
+        for session_id in list(self._dirty):
+            meta = self._cache.get(session_id)
+            if meta is None:
+                self._dirty.discard(session_id)
+                continue
+            try:
+                self.save(meta)
+            except Exception as e:
+                # Still dirty; keep flushing the others and retry it later
+                failed = True
+                logger.error(
+                    f"Failed to flush session metadata: {e}",
+                    extra={"sessionId": session_id},
+                )
+        if failed:
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Arm the debounce timer on the running event loop, if any.
+
+        Without a running loop, pending updates wait for the next activity
+        update or an explicit flush.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._flush_handle is not None and self._flush_loop is loop:
+            return
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        self._flush_loop = loop
+        self._flush_handle = loop.call_later(self._activity_flush_delay, self._on_flush_timer)
+
+    def _on_flush_timer(self) -> None:
+        """Flush pending activity updates when the debounce timer fires."""
+        self._flush_handle = None
+        self._flush_loop = None
+        self.flush()
 
     def create(
         self,
@@ -114,18 +202,29 @@ class MetaStore:
             error=error,
         )
         self.save(meta)
-        return meta
+        return replace(meta)
 
     def update_activity(self, session_id: str) -> None:
         """Update the last activity timestamp.
 
+        Inside a running event loop the write is deferred and coalesced
+        with other activity updates; load() already sees the new value.
+
         Args:
             session_id: Session UUID
         """
-        meta = self.load(session_id)
-        if meta:
-            meta.lastActivityAt = utc_now_iso()
+        meta = self._get(session_id)
+        if not meta:
+            return
+        meta.lastActivityAt = utc_now_iso()
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
             self.save(meta)
+            return
+        # Called for every chunk of terminal I/O, so batch the writes
+        self._dirty.add(session_id)
+        self._schedule_flush()
 
     def update_status(
         self,
@@ -140,7 +239,7 @@ class MetaStore:
             status: New status
             exit_code: Exit code if exited
         """
-        meta = self.load(session_id)
+        meta = self._get(session_id)
         if meta:
             meta.status = status
             meta.lastActivityAt = utc_now_iso()
@@ -161,7 +260,7 @@ class MetaStore:
             cols: New column count
             rows: New row count
         """
-        meta = self.load(session_id)
+        meta = self._get(session_id)
         if meta:
             meta.cols = cols
             meta.rows = rows
@@ -171,3 +270,4 @@ class MetaStore:
 
 # Global meta store instance
 meta_store = MetaStore()
+atexit.register(meta_store.flush)
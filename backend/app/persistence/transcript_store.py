@@ -1,9 +1,12 @@
 """Transcript store for managing session transcript.jsonl files."""
-import json
+import asyncio
+import atexit
+import base64
+import io
 from pathlib import Path
 from typing import Any, Literal
 
-import aiofiles
+import orjson
 
 from app.util.paths import get_transcript_path
 from app.util.time import utc_now_iso
@@ -12,14 +15,36 @@ from app.util.time import utc_now_iso
 class TranscriptStore:
     """Manages session transcript.jsonl files with append-only event sourcing."""
 
-    def __init__(self, base_path: Path | None = None) -> None:
+    def __init__(
+        self,
+        base_path: Path | None = None,
+        flush_delay: float = 0.016,
+        max_pending_bytes: int = 65536,
+    ) -> None:
         """Initialize the transcript store.
 
         Args:
             base_path: Optional base path for sessions (for testing)
+            flush_delay: Seconds to coalesce appended events before writing
+                when called from a running event loop
+            max_pending_bytes: Buffered bytes per session that force an
+                immediate write
         """
         self._base_path = base_path
+        self._flush_delay = flush_delay
+        self._max_pending_bytes = max_pending_bytes
         self._seq_counters: dict[str, int] = {}
+        # Encoded lines per session not yet written to disk
+        self._pending: dict[str, list[bytes]] = {}
+        self._pending_bytes: dict[str, int] = {}
+        # Append handles kept open for the life of each session
+        self._files: dict[str, io.BufferedWriter] = {}
+        # Sessions closed since their last init; later writes don't keep a handle
+        self._closed: set[str] = set()
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_loop: asyncio.AbstractEventLoop | None = None
+        # session_id -> ((mtime_ns, size), parsed events)
+        self._event_cache: dict[str, tuple[tuple[int, int], list[dict[str, Any]]]] = {}
 
     def _get_transcript_path(self, session_id: str) -> Path:
         """Get the transcript.jsonl path for a session.
@@ -92,17 +117,63 @@ class TranscriptStore:
         # Ensure directory exists
         transcript_path = self._get_transcript_path(session_id)
         transcript_path.parent.mkdir(parents=True, exist_ok=True)
-        # Create empty file
-        transcript_path.touch()
+        # Create the file and keep it open for appends
+        self._close_file(session_id)
+        self._closed.discard(session_id)
+        self._files[session_id] = open(transcript_path, "ab")
+
+    def _get_file(self, session_id: str) -> io.BufferedWriter:
+        """Get the session's append handle, opening it if needed.
+
+        Args:
+            session_id: Session UUID
 
-    async def append_output(self, session_id: str, data: str) -> None:
+        Returns:
+            Binary append-mode handle for the session's transcript
+        """
+        f = self._files.get(session_id)
+        if f is None:
+            f = open(self._get_transcript_path(session_id), "ab")
+            self._files[session_id] = f
+        return f
+
+    def _close_file(self, session_id: str) -> None:
+        """Close the session's append handle, if open.
+
+        Args:
+            session_id: Session UUID
+        """
+        f = self._files.pop(session_id, None)
+        if f is not None:
+            f.close()
+
+    def _create_output_event(self, session_id: str, data: bytes | str) -> dict[str, Any]:
+        """Create a terminal output event.
+
+        Raw bytes are stored base64-encoded under ``data_b64`` instead of
+        being decoded to text first.
+
+        Args:
+            session_id: Session UUID
+            data: Output data as raw bytes or a string
+
+        Returns:
+            Event dictionary
+        """
+        if isinstance(data, bytes):
+            return self._create_event(
+                session_id, "out", data_b64=base64.b64encode(data).decode("ascii")
+            )
+        return self._create_event(session_id, "out", data=data)
+
+    async def append_output(self, session_id: str, data: bytes | str) -> None:
         """Append terminal output event.
 
         Args:
             session_id: Session UUID
-            data: Output data string
+            data: Output data as raw bytes or a string
         """
-        event = self._create_event(session_id, "out", data=data)
+        event = self._create_output_event(session_id, data)
         await self._append_event(session_id, event)
 
     async def append_input(self, session_id: str, data: str) -> None:
@@ -156,19 +227,16 @@ class TranscriptStore:
             session_id: Session UUID
             event: Event dictionary to append
         """
-        transcript_path = self._get_transcript_path(session_id)
-        line = json.dumps(event, ensure_ascii=False) + "\n"
-        async with aiofiles.open(transcript_path, "a", encoding="utf-8") as f:
-            await f.write(line)
+        self._append_event_sync(session_id, event)
 
-    def append_output_sync(self, session_id: str, data: str) -> None:
+    def append_output_sync(self, session_id: str, data: bytes | str) -> None:
         """Synchronously append terminal output event (for non-async contexts).
 
         Args:
             session_id: Session UUID
-            data: Output data string
+            data: Output data as raw bytes or a string
         """
-        event = self._create_event(session_id, "out", data=data)
+        event = self._create_output_event(session_id, data)
         self._append_event_sync(session_id, event)
 
     def append_input_sync(self, session_id: str, data: str) -> None:
@@ -205,38 +273,130 @@ class TranscriptStore:
         self._append_event_sync(session_id, event)
 
     def _append_event_sync(self, session_id: str, event: dict[str, Any]) -> None:
-        """Synchronously append an event to the transcript file.
+        """Buffer an event for the transcript file and schedule it to be written.
+
+        Inside a running event loop, events appended within flush_delay of
+        each other are written together. Without a loop, or once a session's
+        buffer reaches max_pending_bytes, the buffer is written immediately.
 
         Args:
             session_id: Session UUID
             event: Event dictionary to append
         """
-        transcript_path = self._get_transcript_path(session_id)
-        line = json.dumps(event, ensure_ascii=False) + "\n"
-        with open(transcript_path, "a", encoding="utf-8") as f:
-            f.write(line)
+        self._event_cache.pop(session_id, None)
+        line = orjson.dumps(event, option=orjson.OPT_APPEND_NEWLINE)
+        self._pending.setdefault(session_id, []).append(line)
+        pending_bytes = self._pending_bytes.get(session_id, 0) + len(line)
+        self._pending_bytes[session_id] = pending_bytes
+        if pending_bytes >= self._max_pending_bytes:
+            self._flush_session(session_id)
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._flush_session(session_id)
+            return
+        if self._flush_handle is not None and self._flush_loop is loop:
+            return
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        self._flush_loop = loop
+        self._flush_handle = loop.call_later(self._flush_delay, self._on_flush_timer)
+
+    def _flush_session(self, session_id: str) -> None:
+        """Write a session's buffered events to its transcript file.
+
+        Args:
+            session_id: Session UUID
+        """
+        lines = self._pending.pop(session_id, None)
+        self._pending_bytes.pop(session_id, None)
+        if not lines:
+            return
+        data = b"".join(lines)
+        if session_id in self._closed:
+            # Late event for a closed session: append without keeping a handle
+            with open(self._get_transcript_path(session_id), "ab") as closed_file:
+                closed_file.write(data)
+            return
+        f = self._get_file(session_id)
+        f.write(data)
+        f.flush()
+
+    def flush(self) -> None:
+        """Write all buffered events to disk immediately."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+            self._flush_loop = None
+        for session_id in list(self._pending):
+            self._flush_session(session_id)
+
+    def _on_flush_timer(self) -> None:
+        """Flush buffered events when the coalescing timer fires."""
+        self._flush_handle = None
+        self._flush_loop = None
+        self.flush()
+
+    def close_session(self, session_id: str) -> None:
+        """Write a session's buffered events, close its file and drop cached state.
+
+        Events appended after this are still written, but through a
+        short-lived handle, until the session is initialized again.
+
+        Args:
+            session_id: Session UUID
+        """
+        self._flush_session(session_id)
+        self._close_file(session_id)
+        self._closed.add(session_id)
+        self._event_cache.pop(session_id, None)
+
+    def close(self) -> None:
+        """Write all buffered events and close every open transcript file."""
+        self.flush()
+        for session_id in list(self._files):
+            self._close_file(session_id)
 
     def read_all_events(self, session_id: str) -> list[dict[str, Any]]:
         """Read all events from a session transcript.
 
+        Buffered events are written first. Parsed events are cached and
+        reused until the file's mtime or size changes, or an event is
+        appended through this store. Output appended as bytes keeps its
+        base64 ``data_b64`` string, so every event stays JSON-serializable.
+
         Args:
             session_id: Session UUID
 
         Returns:
             List of event dictionaries
         """
+        self._flush_session(session_id)
         transcript_path = self._get_transcript_path(session_id)
+        try:
+            st = transcript_path.stat()
+        except FileNotFoundError:
+            self._event_cache.pop(session_id, None)
+            return []
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._event_cache.get(session_id)
+        if cached is not None and cached[0] == key:
+            return list(cached[1])
+
         events = []
         try:
-            with open(transcript_path, "r", encoding="utf-8") as f:
+            with open(transcript_path, "rb") as f:
                 for line in f:
                     line = line.strip()
                     if line:
-                        events.append(json.loads(line))
+                        events.append(orjson.loads(line))
         except FileNotFoundError:
-            pass
-        return events
+            return []
+        self._event_cache[session_id] = (key, events)
+        return list(events)
 
 
 # Global transcript store instance
 transcript_store = TranscriptStore()
+atexit.register(transcript_store.close)
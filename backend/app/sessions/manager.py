@@ -2,7 +2,7 @@
 import asyncio
 import uuid
 from pathlib import Path
-from typing import Any, Callable
+from typing import Protocol
 
 from app.config import settings
 from app.logging_setup import get_logger
@@ -12,11 +12,30 @@ from app.persistence.transcript_store import transcript_store
 from app.sessions.pty_process import PtyProcess, create_pty_process
 from app.util.paths import ensure_session_directories, get_workspace_path
 from app.util.time import utc_now_iso
-from app.ws.protocol import ErrorCodes, SessionInfo, SessionIndexEntry
+from app.ws.protocol import (
+    ErrorCodes,
+    SessionInfo,
+    SessionIndexEntry,
+    is_valid_session_id,
+)
 
 logger = get_logger(__name__)
 
 
+class SessionSubscriber(Protocol):
+    """Receiver of output and exit notifications for attached sessions."""
+
+    client_id: str
+
+    async def handle_output(self, session_id: str, data: str) -> None:
+        """Handle terminal output from a session."""
+        ...
+
+    async def handle_exit(self, session_id: str, exit_code: int | None) -> None:
+        """Handle a session's process exit."""
+        ...
+
+
 class Session:
     """Represents an active terminal session."""
 
@@ -37,6 +56,7 @@ class Session:
         self.pty = pty
         self.meta = meta
         self.attached_clients: set[str] = set()
+        self.subscribers: list[SessionSubscriber] = []
 
     @property
     def is_running(self) -> bool:
@@ -80,8 +100,6 @@ class SessionManager:
         """
         self._sessions: dict[str, Session] = {}
         self._use_mock_pty = use_mock_pty
-        self._output_callbacks: dict[str, Callable[[str, str], Any]] = {}
-        self._exit_callbacks: dict[str, Callable[[str, int | None], Any]] = {}
         self._lock = asyncio.Lock()
 
     @property
@@ -93,52 +111,11 @@ class SessionManager:
         """
         return sum(1 for s in self._sessions.values() if s.is_running)
 
-    def set_output_callback(
-        self, client_id: str, callback: Callable[[str, str], Any]
-    ) -> None:
-        """Set output callback for a client.
-
-        Registers a callback function that will be invoked when terminal
-        output is received from any session the client is attached to.
-
-        Args:
-            client_id: Unique identifier for the WebSocket client.
-            callback: Callback function that receives (session_id, data)
-                where session_id is the UUID and data is the terminal output.
-        """
-        self._output_callbacks[client_id] = callback
-
-    def set_exit_callback(
-        self, client_id: str, callback: Callable[[str, int | None], Any]
-    ) -> None:
-        """Set exit callback for a client.
-
-        Registers a callback function that will be invoked when a session's
-        PTY process exits.
-
-        Args:
-            client_id: Unique identifier for the WebSocket client.
-            callback: Callback function that receives (session_id, exit_code)
-                where exit_code may be None if the process was killed.
-        """
-        self._exit_callbacks[client_id] = callback
-
-    def remove_client_callbacks(self, client_id: str) -> None:
-        """Remove all callbacks for a client.
-
-        Cleans up both output and exit callbacks when a client disconnects.
-
-        Args:
-            client_id: Unique identifier for the WebSocket client to remove.
-        """
-        self._output_callbacks.pop(client_id, None)
-        self._exit_callbacks.pop(client_id, None)
-
     async def _on_pty_output(self, session_id: str, data: str) -> None:
         """Handle PTY output from a terminal session.
 
         Appends output to the transcript, updates activity timestamp, and
-        notifies all attached clients via their registered callbacks.
+        notifies all subscribers attached to the session.
 
         Args:
             session_id: UUID of the session that produced output.
@@ -155,21 +132,17 @@ class SessionManager:
         meta_store.update_activity(session_id)
 
         # Notify attached clients
-        for client_id in session.attached_clients:
-            callback = self._output_callbacks.get(client_id)
-            if callback:
-                try:
-                    result = callback(session_id, data)
-                    if asyncio.iscoroutine(result):
-                        await result
-                except Exception as e:
-                    logger.error(f"Output callback error: {e}")
+        for subscriber in session.subscribers:
+            try:
+                await subscriber.handle_output(session_id, data)
+            except Exception as e:
+                logger.error(f"Output callback error: {e}")
 
     async def _on_pty_exit(self, session_id: str, exit_code: int | None) -> None:
         """Handle PTY process exit.
 
         Updates session status in persistence stores, logs the exit event,
-        and notifies all attached clients via their registered callbacks.
+        and notifies all subscribers attached to the session.
 
         Args:
             session_id: UUID of the session whose process exited.
@@ -185,17 +158,14 @@ class SessionManager:
         await transcript_store.append_lifecycle(
             session_id, "exited", {"exitCode": exit_code}
         )
+        transcript_store.close_session(session_id)
 
         # Notify attached clients
-        for client_id in list(session.attached_clients):
-            callback = self._exit_callbacks.get(client_id)
-            if callback:
-                try:
-                    result = callback(session_id, exit_code)
-                    if asyncio.iscoroutine(result):
-                        await result
-                except Exception as e:
-                    logger.error(f"Exit callback error: {e}")
+        for subscriber in list(session.subscribers):
+            try:
+                await subscriber.handle_exit(session_id, exit_code)
+            except Exception as e:
+                logger.error(f"Exit callback error: {e}")
 
     async def create_session(
         self,
@@ -333,7 +303,10 @@ class SessionManager:
         return self._sessions.get(session_id)
 
     async def attach_session(
-        self, session_id: str, client_id: str
+        self,
+        session_id: str,
+        client_id: str,
+        subscriber: SessionSubscriber | None = None,
     ) -> tuple[Session | None, str | None, str | None]:
         """Attach a client to a session.
 
@@ -343,6 +316,8 @@ class SessionManager:
         Args:
             session_id: UUID of the session to attach to.
             client_id: Unique identifier for the WebSocket client.
+            subscriber: Optional receiver for the session's output and exit
+                notifications, stored directly on the session.
 
         Returns:
             tuple[Session | None, str | None, str | None]: A tuple containing:
@@ -353,8 +328,9 @@ class SessionManager:
         session = self._sessions.get(session_id)
 
         if not session:
-            # Check if session exists in persistence
-            meta = meta_store.load(session_id)
+            # Check if session exists in persistence; a malformed id can't
+            # name a session directory, so skip the disk lookup for it
+            meta = meta_store.load(session_id) if is_valid_session_id(session_id) else None
             if not meta:
                 return (
                     None,
@@ -371,6 +347,8 @@ class SessionManager:
             )
 
         session.attached_clients.add(client_id)
+        if subscriber is not None and subscriber not in session.subscribers:
+            session.subscribers.append(subscriber)
 
         # Log attach
         await transcript_store.append_lifecycle(
@@ -396,7 +374,7 @@ class SessionManager:
         """
         session = self._sessions.get(session_id)
         if session:
-            session.attached_clients.discard(client_id)
+            self._remove_client(session, client_id)
 
     def detach_all_sessions(self, client_id: str) -> None:
         """Detach a client from all sessions.
@@ -408,7 +386,24 @@ class SessionManager:
             client_id: Unique identifier for the WebSocket client.
         """
         for session in self._sessions.values():
-            session.attached_clients.discard(client_id)
+            self._remove_client(session, client_id)
+
+    @staticmethod
+    def _remove_client(session: Session, client_id: str) -> None:
+        """Remove a client and its subscriber from a session.
+
+        The subscriber list is rebuilt rather than mutated so an in-progress
+        output fan-out keeps iterating over a consistent list.
+
+        Args:
+            session: Session to remove the client from.
+            client_id: Unique identifier for the WebSocket client.
+        """
+        session.attached_clients.discard(client_id)
+        if session.subscribers:
+            session.subscribers = [
+                s for s in session.subscribers if s.client_id != client_id
+            ]
 
     async def terminate_session(
         self, session_id: str
@@ -444,6 +439,7 @@ class SessionManager:
         await transcript_store.append_lifecycle(
             session_id, "terminated", {"exitCode": exit_code}
         )
+        transcript_store.close_session(session_id)
 
         logger.info(
             "Session terminated",
@@ -569,3 +565,15 @@ class SessionManager:
 
 # Global session manager instance
 session_manager = SessionManager()
+
+
+def get_session_manager() -> SessionManager:
+    """Provide the session manager for request handling.
+
+    Used as a FastAPI dependency so tests can substitute their own manager
+    through ``app.dependency_overrides``.
+
+    Returns:
+        SessionManager: The global session manager instance.
+    """
+    return session_manager
@@ -357,6 +357,7 @@ class MockPtyProcess(PtyProcess):
             session_id, workspace_path, cols, rows, on_output, on_exit
         )
         self._input_buffer: list[str] = []
+        self._input_ready = asyncio.Event()
         self._mock_exit_code = 0
 
     def spawn(self, copilot_path: str | None = None) -> tuple[bool, str | None]:
@@ -387,9 +388,8 @@ class MockPtyProcess(PtyProcess):
     async def _mock_read_loop(self) -> None:
         """Mock read loop that sends welcome message and echoes input.
 
-        Sends an initial welcome message, then continuously checks the
-        input buffer and echoes any buffered input back via the on_output
-        callback.
+        Sends an initial welcome message, then waits for input to be
+        buffered and echoes it back via the on_output callback.
         """
         # Send welcome message
         if self.on_output:
@@ -400,8 +400,10 @@ class MockPtyProcess(PtyProcess):
             )
 
         while self._running:
-            await asyncio.sleep(0.1)
-            if self._input_buffer:
+            # Woken by write() or terminate() instead of polling
+            await self._input_ready.wait()
+            self._input_ready.clear()
+            while self._running and self._input_buffer:
                 data = self._input_buffer.pop(0)
                 if self.on_output:
                     # Echo input back
@@ -419,6 +421,7 @@ class MockPtyProcess(PtyProcess):
         """
         if self._running:
             self._input_buffer.append(data)
+            self._input_ready.set()
 
     def resize(self, cols: int, rows: int) -> bool:
         """Resize the mock PTY.
@@ -443,6 +446,7 @@ class MockPtyProcess(PtyProcess):
         """
         self._running = False
         self._exit_code = self._mock_exit_code
+        self._input_ready.set()
 
 
 def create_pty_process(
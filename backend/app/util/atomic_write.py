@@ -1,5 +1,5 @@
 """Atomic file write utility to prevent partial writes."""
-import json
+import mmap
 import os
 import sys
 import tempfile
@@ -7,8 +7,12 @@ import time
 from pathlib import Path
 from typing import Any
 
+import orjson
 
-def atomic_write_json(path: Path, data: Any, max_retries: int = 5) -> None:
+
+def atomic_write_json(
+    path: Path, data: Any, max_retries: int = 5, *, indent: bool = True
+) -> None:
     """Write JSON data to a file atomically.
 
     Uses a temporary file and rename to ensure the target file
@@ -18,6 +22,7 @@ def atomic_write_json(path: Path, data: Any, max_retries: int = 5) -> None:
         path: Target file path
         data: Data to serialize as JSON
         max_retries: Maximum retries for Windows file access issues
+        indent: Pretty-print with two-space indentation; compact otherwise
     """
     # Ensure parent directory exists
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -29,10 +34,18 @@ def atomic_write_json(path: Path, data: Any, max_retries: int = 5) -> None:
         suffix=".json",
     )
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-            f.flush()
-            os.fsync(f.fileno())
+        # Write the encoded bytes straight to the descriptor; os.write may
+        # return short counts, so loop until the whole payload is written
+        option = orjson.OPT_APPEND_NEWLINE
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        payload = memoryview(orjson.dumps(data, option=option))
+        try:
+            while payload:
+                payload = payload[os.write(fd, payload):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
 
         # Atomic rename with retry for Windows file locking issues
         temp = Path(temp_path)
@@ -72,5 +85,12 @@ def read_json_file(path: Path) -> Any:
         FileNotFoundError: If file does not exist
         json.JSONDecodeError: If file is not valid JSON
     """
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        # mmap cannot map an empty file; let the parser report it as invalid
+        if os.fstat(f.fileno()).st_size == 0:
+            return orjson.loads(b"")
+        # Parse straight from the mapped pages; the view must be released
+        # before the mapping is closed
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
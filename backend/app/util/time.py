@@ -1,19 +1,32 @@
 """Utility functions for time handling."""
-from datetime import datetime, timezone
+import time
+from datetime import datetime
+from functools import lru_cache
 
 
 def utc_now_iso() -> str:
     """Get current UTC time as ISO-8601 string with millisecond precision.
 
+    Formats straight from the epoch clock; no datetime object is built.
+
     Returns:
         str: Current UTC timestamp in format 'YYYY-MM-DDTHH:MM:SS.sssZ'.
     """
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+    secs, ns = divmod(time.time_ns(), 1_000_000_000)
+    t = time.gmtime(secs)
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}.{ns // 1_000_000:03d}Z"
+    )
 
 
+@lru_cache(maxsize=4096)
 def parse_iso_timestamp(ts: str) -> datetime:
     """Parse an ISO-8601 timestamp string to datetime.
 
+    Results are cached; transcript replay parses the same timestamps
+    repeatedly and datetimes are immutable.
+
     Args:
         ts: ISO-8601 formatted timestamp string, with or without 'Z' suffix.
 
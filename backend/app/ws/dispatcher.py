@@ -1,29 +1,40 @@
 """WebSocket message dispatcher for routing messages to handlers."""
-import json
 import logging
-from typing import Any, Callable, Awaitable
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Awaitable
 
-from pydantic import ValidationError
+import orjson
+from pydantic import BaseModel, ValidationError
 
 from app.ws.protocol import (
+    CLIENT_MESSAGE_MODELS,
     ClientMessage,
     ErrorCodes,
-    ErrorMessage,
-    parse_client_message,
-    SessionCreateMessage,
-    SessionAttachMessage,
-    SessionListMessage,
-    SessionTerminateMessage,
-    TerminalInputMessage,
-    TerminalResizeMessage,
+    error_payload,
 )
-from app.logging_setup import get_logger
+from app.logging_setup import fast_emit, get_logger
+
+if TYPE_CHECKING:
+    from app.ws.router import WebSocketConnection
 
 logger = get_logger(__name__)
 
 
 # Type alias for async handler functions
-Handler = Callable[[str, ClientMessage], Awaitable[dict[str, Any] | None]]
+Handler = Callable[["WebSocketConnection", ClientMessage], Awaitable[dict[str, Any] | None]]
+
+# Type alias for bound model validators
+Validator = Callable[[Any], ClientMessage]
+
+
+# Fixed error responses, built once and shared read-only across dispatches
+_ERR_MISSING_TYPE: Mapping[str, Any] = MappingProxyType(
+    error_payload(ErrorCodes.INVALID_MESSAGE, "Message must have a 'type' field")
+)
+_ERR_INTERNAL: Mapping[str, Any] = MappingProxyType(
+    error_payload(ErrorCodes.INTERNAL_ERROR, "Unhandled server error. See logs.")
+)
 
 
 class MessageDispatcher:
@@ -31,66 +42,95 @@ class MessageDispatcher:
 
     def __init__(self) -> None:
         """Initialize the dispatcher."""
-        self._handlers: dict[str, Handler] = {}
-
-    def register(self, message_type: str, handler: Handler) -> None:
+        self._routes: dict[str, tuple[Handler, Validator]] = {}
+
+    def register(
+        self,
+        message_type: str,
+        handler: Handler,
+        model: type[BaseModel] | None = None,
+    ) -> None:
         """Register a handler for a message type.
 
+        The model's pydantic-core validator is resolved here once, so
+        dispatching a message is a single table lookup followed by a direct
+        validator call, skipping model_validate's per-call wrapper.
+
         Args:
             message_type: Message type string
             handler: Async handler function
+            model: Message model to validate with; defaults to the protocol
+                model for message_type
+
+        Raises:
+            ValueError: If message_type has no protocol model and none is given
         """
-        self._handlers[message_type] = handler
+        model = model or CLIENT_MESSAGE_MODELS.get(message_type)
+        if model is None:
+            raise ValueError(f"Unknown message type: {message_type}")
+        validate = model.__pydantic_validator__.validate_python
+        self._routes[message_type] = (handler, validate)
+
+    @staticmethod
+    def _reject_unroutable(client_id: str, data: Any) -> Mapping[str, Any]:
+        """Build the error response for a message that matched no route.
+
+        Args:
+            client_id: Client the message came from
+            data: Parsed message
+
+        Returns:
+            Missing-type or unknown-type error response
+        """
+        msg_type = data.get("type") if isinstance(data, dict) else None
+        if not msg_type:
+            logger.warning(
+                "Message missing type field",
+                extra={"clientId": client_id},
+            )
+            return _ERR_MISSING_TYPE
+        logger.warning(
+            "Unknown message type",
+            extra={"clientId": client_id, "type": msg_type},
+        )
+        return error_payload(ErrorCodes.UNKNOWN_MESSAGE_TYPE, f"Unknown message type: {msg_type}")
 
     async def dispatch(
-        self, client_id: str, raw_message: str
-    ) -> dict[str, Any] | None:
+        self, conn: "WebSocketConnection", raw_message: str
+    ) -> Mapping[str, Any] | None:
         """Parse and dispatch a message to the appropriate handler.
 
         Args:
-            client_id: Client identifier
+            conn: Connection the message was received on
             raw_message: Raw JSON message string
 
         Returns:
-            Response dict or None if no response needed
+            Response mapping or None if no response needed. Fixed error
+            responses are shared read-only mappings.
         """
+        client_id = conn.client_id
+
         # Parse JSON
         try:
-            data = json.loads(raw_message)
-        except json.JSONDecodeError as e:
+            data = orjson.loads(raw_message)
+        except orjson.JSONDecodeError as e:
             logger.warning(
                 "Invalid JSON received",
                 extra={"clientId": client_id, "error": str(e)},
             )
-            return ErrorMessage(
-                code=ErrorCodes.INVALID_MESSAGE,
-                message=f"Invalid JSON: {str(e)}",
-            ).model_dump()
+            return error_payload(ErrorCodes.INVALID_MESSAGE, f"Invalid JSON: {str(e)}")
 
-        # Get message type
-        msg_type = data.get("type")
-        if not msg_type:
-            logger.warning(
-                "Message missing type field",
-                extra={"clientId": client_id},
-            )
-            return ErrorMessage(
-                code=ErrorCodes.INVALID_MESSAGE,
-                message="Message must have a 'type' field",
-            ).model_dump()
+        # Find handler and validator; a missing type or non-object message
+        # falls out of the lookup and is classified off the hot path
+        try:
+            msg_type = data["type"]
+            handler, validate = self._routes[msg_type]
+        except (KeyError, TypeError):
+            return self._reject_unroutable(client_id, data)
 
-        # Parse and validate message
+        # Validate message
         try:
-            message = parse_client_message(data)
-        except ValueError as e:
-            logger.warning(
-                "Unknown message type",
-                extra={"clientId": client_id, "type": msg_type},
-            )
-            return ErrorMessage(
-                code=ErrorCodes.UNKNOWN_MESSAGE_TYPE,
-                message=str(e),
-            ).model_dump()
+            message = validate(data)
         except ValidationError as e:
             logger.warning(
                 "Message validation failed",
@@ -100,40 +140,19 @@ class MessageDispatcher:
             error_summary = "; ".join(
                 f"{err['loc']}: {err['msg']}" for err in e.errors()
             )
-            return ErrorMessage(
-                code=ErrorCodes.INVALID_MESSAGE,
-                message=error_summary,
-            ).model_dump()
-
-        # Find handler
-        handler = self._handlers.get(msg_type)
-        if not handler:
-            logger.warning(
-                "No handler registered for message type",
-                extra={"clientId": client_id, "type": msg_type},
-            )
-            return ErrorMessage(
-                code=ErrorCodes.UNKNOWN_MESSAGE_TYPE,
-                message=f"Unknown message type: {msg_type}",
-            ).model_dump()
+            return error_payload(ErrorCodes.INVALID_MESSAGE, error_summary)
 
         # Dispatch to handler
         try:
-            logger.debug(
-                f"Dispatching message",
-                extra={"clientId": client_id, "type": msg_type},
-            )
-            return await handler(client_id, message)
+            fast_emit(__name__, "Dispatching message", clientId=client_id, type=msg_type)
+            return await handler(conn, message)
         except Exception as e:
             logger.error(
                 f"Handler error: {e}",
                 extra={"clientId": client_id, "type": msg_type},
                 exc_info=True,
             )
-            return ErrorMessage(
-                code=ErrorCodes.INTERNAL_ERROR,
-                message="Unhandled server error. See logs.",
-            ).model_dump()
+            return _ERR_INTERNAL
 
 
 # Global dispatcher instance
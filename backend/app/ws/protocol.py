@@ -1,9 +1,39 @@
 """WebSocket protocol message models with strict validation."""
-from datetime import datetime, timezone
-from typing import Annotated, Literal, Union
+import re
+from functools import lru_cache
+from typing import Annotated, Any, Literal, Union
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+# Re-exported for callers that build protocol timestamps from this module
+from app.util.time import utc_now_iso as utc_now_iso
+
+
+# Canonical hyphenated UUID, as produced by str(uuid.uuid4())
+SESSION_ID_PATTERN = (
+    r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+)
+_SESSION_ID_RE = re.compile(SESSION_ID_PATTERN)
+
+# Session id field shared by client messages, checked by pydantic-core's regex
+SessionId = Annotated[str, Field(min_length=36, max_length=36, pattern=SESSION_ID_PATTERN)]
+
+
+@lru_cache(maxsize=2048)
+def is_valid_session_id(session_id: str) -> bool:
+    """Check whether a string is a well-formed session id.
+
+    Results are cached since the same few ids recur on every message for
+    a session.
+
+    Args:
+        session_id: Candidate session id
+
+    Returns:
+        True if session_id is a canonical hyphenated UUID
+    """
+    return _SESSION_ID_RE.fullmatch(session_id) is not None
+
 
 # ============================================================================
 # Client -> Server Messages
@@ -24,7 +54,7 @@ class SessionAttachMessage(BaseModel):
     model_config = ConfigDict(extra="forbid")
     
     type: Literal["session.attach"]
-    sessionId: str = Field(..., min_length=36, max_length=36)
+    sessionId: SessionId
 
 
 class SessionListMessage(BaseModel):
@@ -40,7 +70,7 @@ class SessionTerminateMessage(BaseModel):
     model_config = ConfigDict(extra="forbid")
     
     type: Literal["session.terminate"]
-    sessionId: str = Field(..., min_length=36, max_length=36)
+    sessionId: SessionId
 
 
 class SessionRenameMessage(BaseModel):
@@ -49,7 +79,7 @@ class SessionRenameMessage(BaseModel):
     model_config = ConfigDict(extra="forbid")
     
     type: Literal["session.rename"]
-    sessionId: str = Field(..., min_length=36, max_length=36)
+    sessionId: SessionId
     name: str = Field(..., min_length=1, max_length=100)
 
 
@@ -59,7 +89,7 @@ class TerminalInputMessage(BaseModel):
     model_config = ConfigDict(extra="forbid")
     
     type: Literal["term.in"]
-    sessionId: str = Field(..., min_length=36, max_length=36)
+    sessionId: SessionId
     data: str
 
 
@@ -69,7 +99,7 @@ class TerminalResizeMessage(BaseModel):
     model_config = ConfigDict(extra="forbid")
     
     type: Literal["term.resize"]
-    sessionId: str = Field(..., min_length=36, max_length=36)
+    sessionId: SessionId
     cols: int = Field(..., ge=1)
     rows: int = Field(..., ge=1)
 
@@ -88,6 +118,17 @@ ClientMessage = Annotated[
     Field(discriminator="type"),
 ]
 
+# Client message models keyed by their "type" discriminator value
+CLIENT_MESSAGE_MODELS: dict[str, type[BaseModel]] = {
+    "session.create": SessionCreateMessage,
+    "session.attach": SessionAttachMessage,
+    "session.list": SessionListMessage,
+    "session.terminate": SessionTerminateMessage,
+    "session.rename": SessionRenameMessage,
+    "term.in": TerminalInputMessage,
+    "term.resize": TerminalResizeMessage,
+}
+
 
 # ============================================================================
 # Server -> Client Messages
@@ -198,6 +239,22 @@ class ErrorCodes:
     NOT_ATTACHED = "NOT_ATTACHED"
 
 
+def error_payload(code: str, message: str) -> dict[str, Any]:
+    """Build an error message payload.
+
+    Produces the same dict as ``ErrorMessage(...).model_dump()`` without
+    constructing a Pydantic model on every error path.
+
+    Args:
+        code: Error code from ErrorCodes.
+        message: Human-readable error description.
+
+    Returns:
+        Error message dict ready to send.
+    """
+    return {"type": "error", "code": code, "message": message}
+
+
 def parse_client_message(data: dict[str, object]) -> ClientMessage:
     """Parse and validate a client message from raw dict.
 
@@ -211,30 +268,7 @@ def parse_client_message(data: dict[str, object]) -> ClientMessage:
         ValueError: If message validation fails
     """
     msg_type = data.get("type")
-    if msg_type == "session.create":
-        return SessionCreateMessage(**data)  # type: ignore[arg-type]
-    elif msg_type == "session.attach":
-        return SessionAttachMessage(**data)  # type: ignore[arg-type]
-    elif msg_type == "session.list":
-        return SessionListMessage(**data)  # type: ignore[arg-type]
-    elif msg_type == "session.terminate":
-        return SessionTerminateMessage(**data)  # type: ignore[arg-type]
-    elif msg_type == "session.rename":
-        return SessionRenameMessage(**data)  # type: ignore[arg-type]
-    elif msg_type == "term.in":
-        return TerminalInputMessage(**data)  # type: ignore[arg-type]
-    elif msg_type == "term.resize":
-        return TerminalResizeMessage(**data)  # type: ignore[arg-type]
-    else:
+    model = CLIENT_MESSAGE_MODELS.get(msg_type) if isinstance(msg_type, str) else None
+    if model is None:
         raise ValueError(f"Unknown message type: {msg_type}")
-
-
-def utc_now_iso() -> str:
-    """Get current UTC time as ISO-8601 string.
-
-    Returns:
-        str: Current UTC timestamp in ISO-8601 format with millisecond
-            precision (e.g., '2026-01-05T02:04:52.557Z').
-    """
-    from datetime import datetime, timezone
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+    return model.model_validate(data)  # type: ignore[return-value]
@@ -1,38 +1,37 @@
 """WebSocket router and connection handling."""
 import asyncio
-import json
 import time
 import uuid
 from collections import defaultdict
-from typing import Any
+from collections.abc import Mapping
+from typing import Annotated, Any
 
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+import orjson
+from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
 from starlette.websockets import WebSocketState
 
 from app.config import settings
 from app.logging_setup import get_logger
 from app.persistence.index_store import index_store
-from app.sessions.manager import session_manager
+from app.sessions.manager import SessionManager, get_session_manager, session_manager
 from app.util.time import utc_now_iso
 from app.ws.dispatcher import dispatcher
 from app.ws.protocol import (
     ClientMessage,
     ErrorCodes,
-    ErrorMessage,
     ServerHelloMessage,
     SessionAttachedMessage,
     SessionCreateMessage,
     SessionAttachMessage,
     SessionCreatedMessage,
-    SessionExitedMessage,
     SessionListMessage,
     SessionListResultMessage,
     SessionRenameMessage,
     SessionRenamedMessage,
     SessionTerminateMessage,
     TerminalInputMessage,
-    TerminalOutputMessage,
     TerminalResizeMessage,
+    error_payload,
 )
 
 logger = get_logger(__name__)
@@ -40,6 +39,28 @@ logger = get_logger(__name__)
 router = APIRouter()
 
 
+def _session_exited_response(session_id: str, exit_code: int | None) -> dict[str, Any]:
+    """Build a session.exited message payload.
+
+    Args:
+        session_id: Session UUID.
+        exit_code: Exit code or None.
+
+    Returns:
+        Session exited message dict ready to send.
+    """
+    return {"type": "session.exited", "sessionId": session_id, "exitCode": exit_code}
+
+
+# Fixed error payloads, encoded once at import (same format as send_json)
+_RATE_LIMIT_EXCEEDED_TEXT = orjson.dumps(
+    error_payload(
+        ErrorCodes.RATE_LIMIT_EXCEEDED,
+        "Rate limit exceeded. Maximum 200 messages per second.",
+    )
+).decode()
+
+
 class RateLimiter:
     """Simple rate limiter for WebSocket messages."""
 
@@ -63,7 +84,7 @@ class RateLimiter:
         Returns:
             True if within limit, False if exceeded
         """
-        now = time.time()
+        now = time.monotonic()
         window_start = now - self.window_seconds
 
         # Remove old timestamps
@@ -95,37 +116,62 @@ rate_limiter = RateLimiter()
 class WebSocketConnection:
     """Manages a single WebSocket connection."""
 
-    def __init__(self, websocket: WebSocket, client_id: str) -> None:
+    def __init__(
+        self,
+        websocket: WebSocket,
+        client_id: str,
+        manager: SessionManager | None = None,
+    ) -> None:
         """Initialize connection.
 
         Args:
             websocket: FastAPI WebSocket
             client_id: Unique client identifier
+            manager: Session manager serving this connection; defaults to
+                the global instance
         """
         self.websocket = websocket
         self.client_id = client_id
+        self.session_manager = manager or session_manager
         self._attached_session: str | None = None
+        # Encoded start of this connection's term.out frames, up to the data
+        self._output_prefix = ""
 
-    async def send_json(self, data: dict[str, Any]) -> None:
+    async def send_json(self, data: Mapping[str, Any]) -> None:
         """Send JSON message to client.
 
+        Encodes with orjson and sends a text frame, since the frontend
+        parses event.data as a string.
+
         Args:
-            data: Message data to send
+            data: Message data to send; read-only mappings such as the
+                dispatcher's prebuilt errors are encoded as dicts
         """
         if self.websocket.client_state == WebSocketState.CONNECTED:
-            await self.websocket.send_json(data)
+            await self.websocket.send_text(orjson.dumps(data, default=dict).decode())
+
+    async def send_text(self, text: str) -> None:
+        """Send an already-encoded JSON message to client.
+
+        Args:
+            text: JSON-encoded message text
+        """
+        if self.websocket.client_state == WebSocketState.CONNECTED:
+            await self.websocket.send_text(text)
 
     async def handle_output(self, session_id: str, data: str) -> None:
         """Handle terminal output for this connection.
 
+        Sends the same frame as ``TerminalOutputMessage(...).model_dump()``
+        encoded with send_json, built around a per-session pre-encoded prefix.
+
         Args:
             session_id: Session UUID
             data: Output data
         """
         if session_id == self._attached_session:
-            await self.send_json(
-                TerminalOutputMessage(sessionId=session_id, data=data).model_dump()
-            )
+            # Only the data needs encoding; the rest of the frame is fixed
+            await self.send_text(self._output_prefix + orjson.dumps(data).decode() + "}")
 
     async def handle_exit(self, session_id: str, exit_code: int | None) -> None:
         """Handle session exit for this connection.
@@ -135,9 +181,7 @@ class WebSocketConnection:
             exit_code: Exit code or None
         """
         if session_id == self._attached_session:
-            await self.send_json(
-                SessionExitedMessage(sessionId=session_id, exitCode=exit_code).model_dump()
-            )
+            await self.send_json(_session_exited_response(session_id, exit_code))
 
     def attach_to_session(self, session_id: str) -> None:
         """Attach this connection to a session.
@@ -146,6 +190,9 @@ class WebSocketConnection:
             session_id: Session UUID
         """
         self._attached_session = session_id
+        self._output_prefix = (
+            '{"type":"term.out","sessionId":' + orjson.dumps(session_id).decode() + ',"data":'
+        )
 
     def detach_from_session(self) -> None:
         """Detach from current session."""
@@ -157,71 +204,53 @@ class WebSocketConnection:
         return self._attached_session
 
 
-# Store active connections
-_connections: dict[str, WebSocketConnection] = {}
-
-
-def get_connection(client_id: str) -> WebSocketConnection | None:
-    """Get a connection by client ID.
-
-    Args:
-        client_id: Unique client identifier.
-
-    Returns:
-        The WebSocketConnection if found, None otherwise.
-    """
-    return _connections.get(client_id)
-
-
 # ============================================================================
 # Message Handlers
 # ============================================================================
 
 
 async def handle_session_create(
-    client_id: str, message: ClientMessage
+    conn: WebSocketConnection, message: ClientMessage
 ) -> dict[str, Any] | None:
     """Handle session.create message.
 
     Creates a new terminal session and attaches the client to it.
 
     Args:
-        client_id: Unique client identifier.
+        conn: Connection the message was received on.
         message: The client message (SessionCreateMessage).
 
     Returns:
         SessionCreatedMessage on success, ErrorMessage on failure.
     """
-    session, error_code, error_msg = await session_manager.create_session()
+    session, error_code, error_msg = await conn.session_manager.create_session()
 
     if error_code:
-        return ErrorMessage(code=error_code, message=error_msg or "").model_dump()
+        return error_payload(error_code, error_msg or "")
 
     if session:
         # Attach connection to session
-        conn = get_connection(client_id)
-        if conn:
-            conn.attach_to_session(session.session_id)
+        conn.attach_to_session(session.session_id)
 
-        await session_manager.attach_session(session.session_id, client_id)
+        await conn.session_manager.attach_session(session.session_id, conn.client_id, conn)
 
         return SessionCreatedMessage(session=session.to_session_info()).model_dump()
 
-    return ErrorMessage(
-        code=ErrorCodes.INTERNAL_ERROR,
-        message="Failed to create session",
-    ).model_dump()
+    return error_payload(
+        ErrorCodes.INTERNAL_ERROR,
+        "Failed to create session",
+    )
 
 
 async def handle_session_attach(
-    client_id: str, message: ClientMessage
+    conn: WebSocketConnection, message: ClientMessage
 ) -> dict[str, Any] | None:
     """Handle session.attach message.
 
     Attaches the client to an existing terminal session.
 
     Args:
-        client_id: Unique client identifier.
+        conn: Connection the message was received on.
         message: The client message (SessionAttachMessage).
 
     Returns:
@@ -229,57 +258,55 @@ async def handle_session_attach(
     """
     assert isinstance(message, SessionAttachMessage)
 
-    session, error_code, error_msg = await session_manager.attach_session(
-        message.sessionId, client_id
+    session, error_code, error_msg = await conn.session_manager.attach_session(
+        message.sessionId, conn.client_id, conn
     )
 
     if error_code:
-        return ErrorMessage(code=error_code, message=error_msg or "").model_dump()
+        return error_payload(error_code, error_msg or "")
 
     if session:
         # Attach connection to session
-        conn = get_connection(client_id)
-        if conn:
-            conn.attach_to_session(session.session_id)
+        conn.attach_to_session(session.session_id)
 
         return SessionAttachedMessage(
             sessionId=session.session_id,
             status="running" if session.is_running else "exited",
         ).model_dump()
 
-    return ErrorMessage(
-        code=ErrorCodes.INTERNAL_ERROR,
-        message="Failed to attach to session",
-    ).model_dump()
+    return error_payload(
+        ErrorCodes.INTERNAL_ERROR,
+        "Failed to attach to session",
+    )
 
 
 async def handle_session_list(
-    client_id: str, message: ClientMessage
+    conn: WebSocketConnection, message: ClientMessage
 ) -> dict[str, Any] | None:
     """Handle session.list message.
 
     Returns a list of all available terminal sessions.
 
     Args:
-        client_id: Unique client identifier.
+        conn: Connection the message was received on.
         message: The client message (SessionListMessage).
 
     Returns:
         SessionListResultMessage containing the list of sessions.
     """
-    sessions = session_manager.list_sessions()
+    sessions = conn.session_manager.list_sessions()
     return SessionListResultMessage(sessions=sessions).model_dump()
 
 
 async def handle_session_terminate(
-    client_id: str, message: ClientMessage
+    conn: WebSocketConnection, message: ClientMessage
 ) -> dict[str, Any] | None:
     """Handle session.terminate message.
 
     Terminates the specified terminal session.
 
     Args:
-        client_id: Unique client identifier.
+        conn: Connection the message was received on.
         message: The client message (SessionTerminateMessage).
 
     Returns:
@@ -287,27 +314,25 @@ async def handle_session_terminate(
     """
     assert isinstance(message, SessionTerminateMessage)
 
-    exit_code, error_code, error_msg = await session_manager.terminate_session(
+    exit_code, error_code, error_msg = await conn.session_manager.terminate_session(
         message.sessionId
     )
 
     if error_code:
-        return ErrorMessage(code=error_code, message=error_msg or "").model_dump()
+        return error_payload(error_code, error_msg or "")
 
-    return SessionExitedMessage(
-        sessionId=message.sessionId, exitCode=exit_code
-    ).model_dump()
+    return _session_exited_response(message.sessionId, exit_code)
 
 
 async def handle_term_in(
-    client_id: str, message: ClientMessage
+    conn: WebSocketConnection, message: ClientMessage
 ) -> dict[str, Any] | None:
     """Handle term.in message.
 
     Sends input data to the attached terminal session.
 
     Args:
-        client_id: Unique client identifier.
+        conn: Connection the message was received on.
         message: The client message (TerminalInputMessage).
 
     Returns:
@@ -316,33 +341,32 @@ async def handle_term_in(
     assert isinstance(message, TerminalInputMessage)
 
     # Check if client is attached to this session
-    conn = get_connection(client_id)
-    if not conn or conn.attached_session != message.sessionId:
-        return ErrorMessage(
-            code=ErrorCodes.NOT_ATTACHED,
-            message=f"Not attached to session: {message.sessionId}",
-        ).model_dump()
+    if conn.attached_session != message.sessionId:
+        return error_payload(
+            ErrorCodes.NOT_ATTACHED,
+            f"Not attached to session: {message.sessionId}",
+        )
 
-    success, error_code, error_msg = session_manager.send_input(
+    success, error_code, error_msg = conn.session_manager.send_input(
         message.sessionId, message.data
     )
 
     if error_code:
-        return ErrorMessage(code=error_code, message=error_msg or "").model_dump()
+        return error_payload(error_code, error_msg or "")
 
     # No response on success - input is acknowledged implicitly
     return None
 
 
 async def handle_term_resize(
-    client_id: str, message: ClientMessage
+    conn: WebSocketConnection, message: ClientMessage
 ) -> dict[str, Any] | None:
     """Handle term.resize message.
 
     Resizes the terminal to the specified dimensions.
 
     Args:
-        client_id: Unique client identifier.
+        conn: Connection the message was received on.
         message: The client message (TerminalResizeMessage).
 
     Returns:
@@ -350,26 +374,26 @@ async def handle_term_resize(
     """
     assert isinstance(message, TerminalResizeMessage)
 
-    success, error_code, error_msg = session_manager.resize_session(
+    success, error_code, error_msg = conn.session_manager.resize_session(
         message.sessionId, message.cols, message.rows
     )
 
     if error_code:
-        return ErrorMessage(code=error_code, message=error_msg or "").model_dump()
+        return error_payload(error_code, error_msg or "")
 
     # No response on success
     return None
 
 
 async def handle_session_rename(
-    client_id: str, message: ClientMessage
+    conn: WebSocketConnection, message: ClientMessage
 ) -> dict[str, Any] | None:
     """Handle session.rename message.
 
     Renames the specified session.
 
     Args:
-        client_id: Unique client identifier.
+        conn: Connection the message was received on.
         message: The client message (SessionRenameMessage).
 
     Returns:
@@ -380,10 +404,10 @@ async def handle_session_rename(
     success = index_store.update_session_name(message.sessionId, message.name)
 
     if not success:
-        return ErrorMessage(
-            code=ErrorCodes.SESSION_NOT_FOUND,
-            message=f"Session not found: {message.sessionId}",
-        ).model_dump()
+        return error_payload(
+            ErrorCodes.SESSION_NOT_FOUND,
+            f"Session not found: {message.sessionId}",
+        )
 
     return SessionRenamedMessage(
         sessionId=message.sessionId, name=message.name
@@ -401,7 +425,10 @@ dispatcher.register("term.resize", handle_term_resize)
 
 
 @router.websocket("/ws")
-async def websocket_endpoint(websocket: WebSocket) -> None:
+async def websocket_endpoint(
+    websocket: WebSocket,
+    manager: Annotated[SessionManager, Depends(get_session_manager)],
+) -> None:
     """WebSocket endpoint for terminal communication.
 
     Handles WebSocket connections for terminal sessions. Verifies localhost
@@ -409,6 +436,7 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
 
     Args:
         websocket: The FastAPI WebSocket connection.
+        manager: Session manager resolved through dependency injection.
 
     Returns:
         None. Runs until the connection is closed.
@@ -425,12 +453,8 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
     client_id = str(uuid.uuid4())
 
     # Create connection object
-    conn = WebSocketConnection(websocket, client_id)
-    _connections[client_id] = conn
-
-    # Set up callbacks for session manager
-    session_manager.set_output_callback(client_id, conn.handle_output)
-    session_manager.set_exit_callback(client_id, conn.handle_exit)
+    conn = WebSocketConnection(websocket, client_id, manager)
+    check_rate = rate_limiter.check
 
     logger.info("WebSocket connected", extra={"clientId": client_id})
 
@@ -439,30 +463,20 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
         hello = ServerHelloMessage(serverTime=utc_now_iso())
         await conn.send_json(hello.model_dump())
 
-        # Message receive loop
-        while True:
+        # Message receive loop; iter_text() ends cleanly on disconnect
+        async for raw_message in websocket.iter_text():
             # Check rate limit
-            if not rate_limiter.check(client_id):
+            if not check_rate(client_id):
                 logger.warning(
                     "Rate limit exceeded",
                     extra={"clientId": client_id},
                 )
-                await conn.send_json(
-                    ErrorMessage(
-                        code=ErrorCodes.RATE_LIMIT_EXCEEDED,
-                        message="Rate limit exceeded. Maximum 200 messages per second.",
-                    ).model_dump()
-                )
+                await conn.send_text(_RATE_LIMIT_EXCEEDED_TEXT)
                 await websocket.close(code=1011)
                 break
 
-            try:
-                raw_message = await websocket.receive_text()
-            except WebSocketDisconnect:
-                break
-
             # Dispatch message
-            response = await dispatcher.dispatch(client_id, raw_message)
+            response = await dispatcher.dispatch(conn, raw_message)
 
             if response:
                 await conn.send_json(response)
@@ -478,9 +492,7 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
         logger.error(f"WebSocket error: {e}", extra={"clientId": client_id}, exc_info=True)
     finally:
         # Cleanup
-        _connections.pop(client_id, None)
-        session_manager.remove_client_callbacks(client_id)
-        session_manager.detach_all_sessions(client_id)
+        manager.detach_all_sessions(client_id)
         rate_limiter.cleanup(client_id)
 
         logger.info("WebSocket disconnected", extra={"clientId": client_id})
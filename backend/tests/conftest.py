@@ -1,6 +1,8 @@
 """Pytest configuration and fixtures."""
 import os
+import shutil
 import sys
+import tempfile
 from pathlib import Path
 
 import pytest
@@ -8,12 +10,48 @@ import pytest
 # Add app to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-# Set test environment variables before importing app modules
-os.environ["DATA_DIR"] = str(Path(__file__).parent / "test_data")
-os.environ["LOG_FILE"] = str(Path(__file__).parent / "test_data" / "logs" / "app.jsonl")
+# Set test environment variables before importing app modules. Under
+# pytest-xdist each worker gets a fresh data directory for this run, so
+# concurrent workers never write the same index.json and nothing carries
+# over between runs; it is removed when the worker's session ends.
+_worker = os.environ.get("PYTEST_XDIST_WORKER")
+_data_dir = Path(__file__).parent / "test_data"
+if _worker:
+    _data_dir = Path(tempfile.mkdtemp(prefix=f"copilot-carousel-test-data-{_worker}-"))
+os.environ["DATA_DIR"] = str(_data_dir)
+os.environ["LOG_FILE"] = str(_data_dir / "logs" / "app.jsonl")
 os.environ["ALLOW_NON_LOCALHOST"] = "true"
 
 
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    """Remove this xdist worker's per-run data directory.
+
+    Pending store writes are flushed first so nothing is written back into
+    the directory by the exit hooks.
+
+    Args:
+        session: The pytest session that is finishing.
+        exitstatus: The exit status pytest will return.
+    """
+    if not _worker:
+        return
+    from app.logging_setup import close_fast_log
+    from app.persistence.index_store import index_store
+    from app.persistence.meta_store import meta_store
+    from app.persistence.transcript_store import transcript_store
+
+    # Write out pending state now rather than at exit, after the directory is gone
+    meta_store.flush()
+    index_store.flush()
+    transcript_store.close()
+    close_fast_log()
+    shutil.rmtree(_data_dir, ignore_errors=True)
+
+
+# Session id shared by tests that need a well-formed UUID
+SESSION_ID = "12345678-1234-1234-1234-123456789abc"
+
+
 @pytest.fixture
 def temp_data_dir(tmp_path: Path) -> Path:
     """Create a temporary data directory for tests.
@@ -35,14 +73,15 @@ def temp_data_dir(tmp_path: Path) -> Path:
     return data_dir
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def session_id() -> str:
     """Provide a test session ID.
 
     Provides a consistent UUID-formatted string for use as a session
-    identifier in tests.
+    identifier in tests. Strings are immutable, so one value is shared
+    by the whole run.
 
     Returns:
         A valid UUID string for testing session-related functionality.
     """
-    return "12345678-1234-1234-1234-123456789abc"
+    return SESSION_ID
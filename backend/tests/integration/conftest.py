@@ -0,0 +1,45 @@
+"""Shared fixtures for integration tests."""
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.sessions.manager import SessionManager, get_session_manager
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    """Provide a TestClient shared by every integration test.
+
+    Entering the client runs the application lifespan, so startup and
+    shutdown happen once per test session and the ASGI portal is reused.
+
+    Yields:
+        TestClient bound to the FastAPI application.
+    """
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture
+def mock_session_manager(client: TestClient) -> Iterator[SessionManager]:
+    """Serve WebSocket connections from a fresh mock-PTY session manager.
+
+    Overrides the app's session manager dependency for one test and shuts
+    the manager down on the client's event loop afterwards.
+
+    Args:
+        client: Session-scoped TestClient fixture.
+
+    Yields:
+        SessionManager used by connections opened during the test.
+    """
+    manager = SessionManager(use_mock_pty=True)
+    app.dependency_overrides[get_session_manager] = lambda: manager
+    try:
+        yield manager
+    finally:
+        app.dependency_overrides.pop(get_session_manager, None)
+        client.portal.call(manager.shutdown)
+
@@ -1,35 +1,49 @@
 """Integration tests for PTY with echo fixture."""
 import pytest
 from pathlib import Path
+from collections.abc import Iterator
 
 from app.sessions.pty_process import MockPtyProcess, create_pty_process
 
 
-class TestMockPtyProcess:
-    """Tests for MockPtyProcess used in testing."""
+@pytest.fixture(scope="module")
+def workspace(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a workspace directory shared by the tests in this module.
 
-    @pytest.fixture
-    def session_id(self) -> str:
-        """Provide a test session ID.
+    The mock PTY never writes to its workspace, so one directory suffices.
 
-        Returns:
-            str: A valid UUID string for testing.
-        """
-        return "12345678-1234-1234-1234-123456789abc"
+    Args:
+        tmp_path_factory: Pytest's session-scoped temporary path factory.
+
+    Returns:
+        Path: The created workspace directory path.
+    """
+    return tmp_path_factory.mktemp("workspace")
+
+
+class TestMockPtyProcess:
+    """Tests for MockPtyProcess used in testing."""
 
     @pytest.fixture
-    def workspace(self, tmp_path: Path) -> Path:
-        """Create a workspace directory.
+    def pty(self, session_id: str, workspace: Path) -> Iterator[MockPtyProcess]:
+        """Provide a spawned 80x24 mock PTY, terminated after the test.
 
         Args:
-            tmp_path: Pytest's temporary path fixture.
+            session_id: The test session ID fixture.
+            workspace: The test workspace directory fixture.
 
-        Returns:
-            Path: The created workspace directory path.
+        Yields:
+            MockPtyProcess: The spawned mock PTY.
         """
-        workspace = tmp_path / "workspace"
-        workspace.mkdir()
-        return workspace
+        pty = MockPtyProcess(
+            session_id=session_id,
+            workspace_path=workspace,
+            cols=80,
+            rows=24,
+        )
+        pty.spawn()
+        yield pty
+        pty.terminate()
 
     def test_mock_pty_spawn(self, session_id: str, workspace: Path) -> None:
         """Test mock PTY spawning.
@@ -52,67 +66,40 @@ class TestMockPtyProcess:
         assert pty.pid == 99999
         assert pty.is_running
 
-    def test_mock_pty_terminate(self, session_id: str, workspace: Path) -> None:
+    def test_mock_pty_terminate(self, pty: MockPtyProcess) -> None:
         """Test mock PTY termination.
 
         Args:
-            session_id: The test session ID fixture.
-            workspace: The test workspace directory fixture.
+            pty: Spawned mock PTY fixture.
         """
-        pty = MockPtyProcess(
-            session_id=session_id,
-            workspace_path=workspace,
-            cols=80,
-            rows=24,
-        )
-        pty.spawn()
-
         pty.terminate()
 
         assert not pty.is_running
 
-    def test_mock_pty_resize(self, session_id: str, workspace: Path) -> None:
+    def test_mock_pty_resize(self, pty: MockPtyProcess) -> None:
         """Test mock PTY resize.
 
         Args:
-            session_id: The test session ID fixture.
-            workspace: The test workspace directory fixture.
+            pty: Spawned mock PTY fixture.
         """
-        pty = MockPtyProcess(
-            session_id=session_id,
-            workspace_path=workspace,
-            cols=80,
-            rows=24,
-        )
-        pty.spawn()
-
         success = pty.resize(100, 50)
 
         assert success
         assert pty.cols == 100
         assert pty.rows == 50
 
-    def test_mock_pty_write(self, session_id: str, workspace: Path) -> None:
+    def test_mock_pty_write(self, pty: MockPtyProcess) -> None:
         """Test mock PTY write buffers input.
 
         Args:
-            session_id: The test session ID fixture.
-            workspace: The test workspace directory fixture.
+            pty: Spawned mock PTY fixture.
         """
-        pty = MockPtyProcess(
-            session_id=session_id,
-            workspace_path=workspace,
-            cols=80,
-            rows=24,
-        )
-        pty.spawn()
-
         pty.write("test input")
 
         assert len(pty._input_buffer) == 1
         assert pty._input_buffer[0] == "test input"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_mock_pty_output_callback(
         self, session_id: str, workspace: Path
     ) -> None:
@@ -125,15 +112,17 @@ class TestMockPtyProcess:
         import asyncio
 
         outputs: list[tuple[str, str]] = []
+        done = asyncio.Event()
 
         async def on_output(sid: str, data: str) -> None:
-            """Callback to capture PTY output.
+            """Callback to capture PTY output and signal the first arrival.
 
             Args:
                 sid: The session ID.
                 data: The output data string.
             """
             outputs.append((sid, data))
+            done.set()
 
         pty = MockPtyProcess(
             session_id=session_id,
@@ -146,7 +135,7 @@ class TestMockPtyProcess:
         await pty.start_read_loop()
 
         # Wait for welcome message
-        await asyncio.sleep(0.2)
+        await asyncio.wait_for(done.wait(), timeout=2.0)
 
         assert len(outputs) > 0
         assert outputs[0][0] == session_id
@@ -158,29 +147,6 @@ class TestMockPtyProcess:
 class TestPtyProcessFactory:
     """Tests for PTY process factory."""
 
-    @pytest.fixture
-    def session_id(self) -> str:
-        """Provide a test session ID.
-
-        Returns:
-            str: A valid UUID string for testing.
-        """
-        return "12345678-1234-1234-1234-123456789abc"
-
-    @pytest.fixture
-    def workspace(self, tmp_path: Path) -> Path:
-        """Create a workspace directory.
-
-        Args:
-            tmp_path: Pytest's temporary path fixture.
-
-        Returns:
-            Path: The created workspace directory path.
-        """
-        workspace = tmp_path / "workspace"
-        workspace.mkdir()
-        return workspace
-
     def test_create_mock_pty(self, session_id: str, workspace: Path) -> None:
         """Test creating mock PTY.
 
@@ -0,0 +1,39 @@
+"""WebSocket helpers shared by integration tests."""
+from typing import Any
+
+import orjson
+from starlette.testclient import WebSocketTestSession
+
+# Compact server frames serialize "type" first, so terminal output can be
+# recognised from the raw text without decoding it
+_TERM_OUT_PREFIX = '{"type":"term.out"'
+
+
+def recv_until(
+    ws: WebSocketTestSession, expected_type: str | None = None, max_skip: int = 50
+) -> dict[str, Any]:
+    """Receive the next message that is not terminal output.
+
+    Mock PTY sessions emit term.out frames asynchronously, so they may
+    arrive ahead of the response a test is waiting for; those are skipped
+    without being decoded.
+
+    Args:
+        ws: WebSocket test session to read from.
+        expected_type: Optional message type the returned message must have.
+        max_skip: Maximum number of term.out frames to skip before failing.
+
+    Returns:
+        The first decoded message whose type is not term.out.
+    """
+    for _ in range(max_skip + 1):
+        text = ws.receive_text()
+        if not text.startswith(_TERM_OUT_PREFIX):
+            break
+    else:
+        raise AssertionError(f"More than {max_skip} term.out frames before a response")
+
+    message: dict[str, Any] = orjson.loads(text)
+    if expected_type is not None:
+        assert message["type"] == expected_type, f"Expected {expected_type}, got {message}"
+    return message
@@ -0,0 +1,29 @@
+"""Shared fixtures for unit tests."""
+import pytest
+
+from app.config import Settings, get_default_settings
+
+
+@pytest.fixture(scope="session")
+def default_settings() -> Settings:
+    """Provide a Settings instance built from defaults only.
+
+    Delegates to the cached app-side instance; tests that need overrides
+    should build their own Settings instance instead.
+
+    Returns:
+        Settings instance with no environment file applied.
+    """
+    return get_default_settings()
+
+
+@pytest.fixture(scope="session")
+def settings() -> Settings:
+    """Provide a Settings instance loaded like the app's, validated once per run.
+
+    Tests must only read from it.
+
+    Returns:
+        Settings instance shared by the whole test run.
+    """
+    return Settings()
@@ -9,75 +9,81 @@ from app.config import Settings
 class TestConfiguration:
     """Tests for application configuration."""
 
-    def test_default_host_and_port(self) -> None:
+    def test_default_host_and_port(self, default_settings: Settings) -> None:
         """Test default host and port values.
 
         Verifies that Settings uses the expected default values for HOST
         and PORT when no environment file is provided.
+
+        Args:
+            default_settings: Session-scoped default Settings fixture.
         """
-        settings = Settings(_env_file=None)
-        
-        assert settings.HOST == "127.0.0.1"
-        assert settings.PORT == 5000
+        assert default_settings.HOST == "127.0.0.1"
+        assert default_settings.PORT == 5000
 
-    def test_default_session_limits(self) -> None:
+    def test_default_session_limits(self, default_settings: Settings) -> None:
         """Test default session limit values.
 
         Verifies that Settings uses the expected default values for session
         limits including max sessions, input character limits, and WebSocket
         message size limits.
+
+        Args:
+            default_settings: Session-scoped default Settings fixture.
         """
-        settings = Settings(_env_file=None)
-        
-        assert settings.MAX_SESSIONS == 10
-        assert settings.MAX_INPUT_CHARS_PER_MESSAGE == 16384
-        assert settings.WS_MAX_MESSAGE_BYTES == 1048576
+        assert default_settings.MAX_SESSIONS == 10
+        assert default_settings.MAX_INPUT_CHARS_PER_MESSAGE == 16384
+        assert default_settings.WS_MAX_MESSAGE_BYTES == 1048576
 
-    def test_default_terminal_dimensions(self) -> None:
+    def test_default_terminal_dimensions(self, default_settings: Settings) -> None:
         """Test default terminal dimension values.
 
         Verifies that Settings uses the expected default values for terminal
         dimensions including initial, minimum, and maximum columns and rows.
+
+        Args:
+            default_settings: Session-scoped default Settings fixture.
         """
-        settings = Settings(_env_file=None)
-        
-        assert settings.INITIAL_COLS == 120
-        assert settings.INITIAL_ROWS == 30
-        assert settings.MIN_COLS == 20
-        assert settings.MAX_COLS == 300
-        assert settings.MIN_ROWS == 5
-        assert settings.MAX_ROWS == 120
-
-    def test_sessions_dir_property(self) -> None:
+        assert default_settings.INITIAL_COLS == 120
+        assert default_settings.INITIAL_ROWS == 30
+        assert default_settings.MIN_COLS == 20
+        assert default_settings.MAX_COLS == 300
+        assert default_settings.MIN_ROWS == 5
+        assert default_settings.MAX_ROWS == 120
+
+    def test_sessions_dir_property(self, default_settings: Settings) -> None:
         """Test sessions_dir property.
 
         Verifies that the sessions_dir property correctly returns the path
         to the sessions subdirectory within DATA_DIR.
+
+        Args:
+            default_settings: Session-scoped default Settings fixture.
         """
-        settings = Settings(_env_file=None)
-        
-        assert settings.sessions_dir == settings.DATA_DIR / "sessions"
+        assert default_settings.sessions_dir == default_settings.DATA_DIR / "sessions"
 
-    def test_logs_dir_property(self) -> None:
+    def test_logs_dir_property(self, default_settings: Settings) -> None:
         """Test logs_dir property.
 
         Verifies that the logs_dir property correctly returns the path
         to the logs subdirectory within DATA_DIR.
+
+        Args:
+            default_settings: Session-scoped default Settings fixture.
         """
-        settings = Settings(_env_file=None)
-        
-        assert settings.logs_dir == settings.DATA_DIR / "logs"
+        assert default_settings.logs_dir == default_settings.DATA_DIR / "logs"
 
-    def test_validate_localhost_binding_allowed(self) -> None:
+    def test_validate_localhost_binding_allowed(self, default_settings: Settings) -> None:
         """Test that localhost binding is allowed.
 
         Verifies that validate_localhost_binding does not raise an exception
         when HOST is set to 127.0.0.1 (localhost).
+
+        Args:
+            default_settings: Session-scoped default Settings fixture.
         """
-        settings = Settings(HOST="127.0.0.1", _env_file=None)
-        
         # Should not raise
-        settings.validate_localhost_binding()
+        default_settings.validate_localhost_binding()
 
     def test_validate_localhost_binding_rejected(self) -> None:
         """Test that non-localhost binding is rejected.
@@ -1,10 +1,16 @@
 """Unit tests for dispatcher."""
 import pytest
 import json
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
+
+from starlette.websockets import WebSocketState
 
 from app.ws.dispatcher import MessageDispatcher
 from app.ws.protocol import ErrorCodes
+from app.ws.router import WebSocketConnection
+
+# Every test here is async; share one event loop instead of one per test
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
 
 class TestMessageDispatcher:
@@ -19,25 +25,37 @@ class TestMessageDispatcher:
         """
         return MessageDispatcher()
 
-    @pytest.mark.asyncio
-    async def test_dispatch_valid_message(self, dispatcher: MessageDispatcher) -> None:
+    @pytest.fixture
+    def conn(self) -> WebSocketConnection:
+        """Create a connection backed by a mock WebSocket.
+
+        Returns:
+            WebSocketConnection: A connection with client ID 'client-1'.
+        """
+        return WebSocketConnection(MagicMock(), "client-1")
+
+    async def test_dispatch_valid_message(
+        self, dispatcher: MessageDispatcher, conn: WebSocketConnection
+    ) -> None:
         """Test dispatching a valid message.
 
         Args:
             dispatcher: The MessageDispatcher fixture instance.
+            conn: The WebSocketConnection fixture instance.
         """
         handler = AsyncMock(return_value={"type": "test.response"})
         dispatcher.register("session.create", handler)
 
         result = await dispatcher.dispatch(
-            "client-1", json.dumps({"type": "session.create"})
+            conn, json.dumps({"type": "session.create"})
         )
 
         handler.assert_called_once()
         assert result == {"type": "test.response"}
 
-    @pytest.mark.asyncio
-    async def test_dispatch_invalid_json(self, dispatcher: MessageDispatcher) -> None:
+    async def test_dispatch_invalid_json(
+        self, dispatcher: MessageDispatcher, conn: WebSocketConnection
+    ) -> None:
         """Test dispatching invalid JSON.
 
         Verifies that malformed JSON returns an error response with
@@ -45,15 +63,17 @@ class TestMessageDispatcher:
 
         Args:
             dispatcher: The MessageDispatcher fixture instance.
+            conn: The WebSocketConnection fixture instance.
         """
-        result = await dispatcher.dispatch("client-1", "not valid json")
+        result = await dispatcher.dispatch(conn, "not valid json")
 
         assert result is not None
         assert result["type"] == "error"
         assert result["code"] == ErrorCodes.INVALID_MESSAGE
 
-    @pytest.mark.asyncio
-    async def test_dispatch_missing_type(self, dispatcher: MessageDispatcher) -> None:
+    async def test_dispatch_missing_type(
+        self, dispatcher: MessageDispatcher, conn: WebSocketConnection
+    ) -> None:
         """Test dispatching message without type.
 
         Verifies that messages missing the required 'type' field return
@@ -61,15 +81,35 @@ class TestMessageDispatcher:
 
         Args:
             dispatcher: The MessageDispatcher fixture instance.
+            conn: The WebSocketConnection fixture instance.
         """
-        result = await dispatcher.dispatch("client-1", json.dumps({"data": "test"}))
+        result = await dispatcher.dispatch(conn, json.dumps({"data": "test"}))
 
         assert result is not None
         assert result["type"] == "error"
         assert result["code"] == ErrorCodes.INVALID_MESSAGE
 
-    @pytest.mark.asyncio
-    async def test_dispatch_unknown_type(self, dispatcher: MessageDispatcher) -> None:
+    async def test_dispatch_non_object_message(
+        self, dispatcher: MessageDispatcher, conn: WebSocketConnection
+    ) -> None:
+        """Test dispatching valid JSON that is not an object.
+
+        Verifies that arrays and scalars are rejected with INVALID_MESSAGE
+        instead of raising.
+
+        Args:
+            dispatcher: The MessageDispatcher fixture instance.
+            conn: The WebSocketConnection fixture instance.
+        """
+        for raw in ("[1, 2]", '"session.create"', "42"):
+            result = await dispatcher.dispatch(conn, raw)
+
+            assert result is not None
+            assert result["code"] == ErrorCodes.INVALID_MESSAGE
+
+    async def test_dispatch_unknown_type(
+        self, dispatcher: MessageDispatcher, conn: WebSocketConnection
+    ) -> None:
         """Test dispatching unknown message type.
 
         Verifies that messages with unrecognized type values return
@@ -77,18 +117,18 @@ class TestMessageDispatcher:
 
         Args:
             dispatcher: The MessageDispatcher fixture instance.
+            conn: The WebSocketConnection fixture instance.
         """
         result = await dispatcher.dispatch(
-            "client-1", json.dumps({"type": "unknown.type"})
+            conn, json.dumps({"type": "unknown.type"})
         )
 
         assert result is not None
         assert result["type"] == "error"
         assert result["code"] == ErrorCodes.UNKNOWN_MESSAGE_TYPE
 
-    @pytest.mark.asyncio
     async def test_dispatch_validation_error(
-        self, dispatcher: MessageDispatcher
+        self, dispatcher: MessageDispatcher, conn: WebSocketConnection
     ) -> None:
         """Test dispatching message with validation error.
 
@@ -98,13 +138,14 @@ class TestMessageDispatcher:
 
         Args:
             dispatcher: The MessageDispatcher fixture instance.
+            conn: The WebSocketConnection fixture instance.
         """
         handler = AsyncMock()
         dispatcher.register("session.attach", handler)
 
         # Missing required sessionId - should return error
         result = await dispatcher.dispatch(
-            "client-1", json.dumps({"type": "session.attach"})
+            conn, json.dumps({"type": "session.attach"})
         )
 
         assert result is not None
@@ -113,9 +154,8 @@ class TestMessageDispatcher:
         assert result["code"] in (ErrorCodes.INVALID_MESSAGE, ErrorCodes.UNKNOWN_MESSAGE_TYPE)
         handler.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_dispatch_handler_error(
-        self, dispatcher: MessageDispatcher
+        self, dispatcher: MessageDispatcher, conn: WebSocketConnection
     ) -> None:
         """Test dispatching when handler raises exception.
 
@@ -124,20 +164,46 @@ class TestMessageDispatcher:
 
         Args:
             dispatcher: The MessageDispatcher fixture instance.
+            conn: The WebSocketConnection fixture instance.
         """
         handler = AsyncMock(side_effect=Exception("Handler error"))
         dispatcher.register("session.create", handler)
 
         result = await dispatcher.dispatch(
-            "client-1", json.dumps({"type": "session.create"})
+            conn, json.dumps({"type": "session.create"})
         )
 
         assert result is not None
         assert result["type"] == "error"
         assert result["code"] == ErrorCodes.INTERNAL_ERROR
 
-    @pytest.mark.asyncio
-    async def test_dispatch_no_handler(self, dispatcher: MessageDispatcher) -> None:
+    async def test_prebuilt_error_is_sent_as_json(
+        self, dispatcher: MessageDispatcher, conn: WebSocketConnection
+    ) -> None:
+        """Test that a shared read-only error response encodes like a dict.
+
+        Args:
+            dispatcher: The MessageDispatcher fixture instance.
+            conn: The WebSocketConnection fixture instance.
+        """
+        dispatcher.register("session.create", AsyncMock(side_effect=Exception("boom")))
+        conn.websocket.client_state = WebSocketState.CONNECTED
+        conn.websocket.send_text = AsyncMock()
+
+        result = await dispatcher.dispatch(conn, json.dumps({"type": "session.create"}))
+        assert result is not None
+        await conn.send_json(result)
+
+        sent = json.loads(conn.websocket.send_text.call_args.args[0])
+        assert sent == {
+            "type": "error",
+            "code": ErrorCodes.INTERNAL_ERROR,
+            "message": "Unhandled server error. See logs.",
+        }
+
+    async def test_dispatch_no_handler(
+        self, dispatcher: MessageDispatcher, conn: WebSocketConnection
+    ) -> None:
         """Test dispatching when no handler registered.
 
         Verifies that dispatching a message type with no registered handler
@@ -145,17 +211,19 @@ class TestMessageDispatcher:
 
         Args:
             dispatcher: The MessageDispatcher fixture instance.
+            conn: The WebSocketConnection fixture instance.
         """
         result = await dispatcher.dispatch(
-            "client-1", json.dumps({"type": "session.create"})
+            conn, json.dumps({"type": "session.create"})
         )
 
         assert result is not None
         assert result["type"] == "error"
         assert result["code"] == ErrorCodes.UNKNOWN_MESSAGE_TYPE
 
-    @pytest.mark.asyncio
-    async def test_handler_returns_none(self, dispatcher: MessageDispatcher) -> None:
+    async def test_handler_returns_none(
+        self, dispatcher: MessageDispatcher, conn: WebSocketConnection, session_id: str
+    ) -> None:
         """Test handler returning None (no response).
 
         Verifies that handlers can return None to indicate no response
@@ -163,15 +231,17 @@ class TestMessageDispatcher:
 
         Args:
             dispatcher: The MessageDispatcher fixture instance.
+            conn: The WebSocketConnection fixture instance.
+            session_id: The test session ID fixture.
         """
         handler = AsyncMock(return_value=None)
         dispatcher.register("term.in", handler)
 
         result = await dispatcher.dispatch(
-            "client-1",
+            conn,
             json.dumps({
                 "type": "term.in",
-                "sessionId": "12345678-1234-1234-1234-123456789abc",
+                "sessionId": session_id,
                 "data": "test",
             }),
         )
@@ -2,7 +2,9 @@
 import json
 import pytest
 from pathlib import Path
+from typing import Any
 
+from app.persistence import index_store as index_store_module
 from app.persistence.index_store import IndexStore
 
 
@@ -34,6 +36,19 @@ class TestIndexStore:
         assert index["sessions"] == []
         assert "updatedAt" in index
 
+    def test_load_zero_length_index(self, index_store: IndexStore) -> None:
+        """Test loading an empty index file returns empty structure.
+
+        Args:
+            index_store: The IndexStore fixture instance.
+        """
+        index_store.index_path.parent.mkdir(parents=True, exist_ok=True)
+        index_store.index_path.write_bytes(b"")
+
+        index = index_store.load()
+        assert index["protocolVersion"] == 1
+        assert index["sessions"] == []
+
     def test_save_and_load(self, index_store: IndexStore) -> None:
         """Test saving and loading index.
 
@@ -53,13 +68,13 @@ class TestIndexStore:
         assert len(loaded["sessions"]) == 1
         assert loaded["sessions"][0]["sessionId"] == "test-session-id-1234-567890123456"
 
-    def test_add_session(self, index_store: IndexStore) -> None:
+    def test_add_session(self, index_store: IndexStore, session_id: str) -> None:
         """Test adding a session to the index.
 
         Args:
             index_store: The IndexStore fixture instance.
+            session_id: The test session ID fixture.
         """
-        session_id = "12345678-1234-1234-1234-123456789abc"
         index_store.add_session(
             session_id=session_id,
             status="running",
@@ -72,13 +87,13 @@ class TestIndexStore:
         assert index["sessions"][0]["sessionId"] == session_id
         assert index["sessions"][0]["status"] == "running"
 
-    def test_update_session_status(self, index_store: IndexStore) -> None:
+    def test_update_session_status(self, index_store: IndexStore, session_id: str) -> None:
         """Test updating a session's status.
 
         Args:
             index_store: The IndexStore fixture instance.
+            session_id: The test session ID fixture.
         """
-        session_id = "12345678-1234-1234-1234-123456789abc"
         index_store.add_session(
             session_id=session_id,
             status="running",
@@ -123,13 +138,13 @@ class TestIndexStore:
         assert sessions[1].sessionId == "session-3-cccccccccccccccccccccccc"
         assert sessions[2].sessionId == "session-1-aaaaaaaaaaaaaaaaaaaaaaaa"
 
-    def test_get_session(self, index_store: IndexStore) -> None:
+    def test_get_session(self, index_store: IndexStore, session_id: str) -> None:
         """Test getting a specific session.
 
         Args:
             index_store: The IndexStore fixture instance.
+            session_id: The test session ID fixture.
         """
-        session_id = "12345678-1234-1234-1234-123456789abc"
         index_store.add_session(
             session_id=session_id,
             status="running",
@@ -150,13 +165,13 @@ class TestIndexStore:
         session = index_store.get_session("nonexistent-id-12345678901234")
         assert session is None
 
-    def test_remove_session(self, index_store: IndexStore) -> None:
+    def test_remove_session(self, index_store: IndexStore, session_id: str) -> None:
         """Test removing a session from the index.
 
         Args:
             index_store: The IndexStore fixture instance.
+            session_id: The test session ID fixture.
         """
-        session_id = "12345678-1234-1234-1234-123456789abc"
         index_store.add_session(
             session_id=session_id,
             status="running",
@@ -169,13 +184,15 @@ class TestIndexStore:
         sessions = index_store.get_all_sessions()
         assert len(sessions) == 0
 
-    def test_atomic_write_produces_valid_json(self, index_store: IndexStore) -> None:
+    def test_atomic_write_produces_valid_json(
+        self, index_store: IndexStore, session_id: str
+    ) -> None:
         """Test that atomic write produces valid JSON.
 
         Args:
             index_store: The IndexStore fixture instance.
+            session_id: The test session ID fixture.
         """
-        session_id = "12345678-1234-1234-1234-123456789abc"
         index_store.add_session(
             session_id=session_id,
             status="running",
@@ -201,3 +218,112 @@ class TestIndexStore:
         index = index_store.load()
         assert index["protocolVersion"] == IndexStore.PROTOCOL_VERSION
         assert index["protocolVersion"] == 1
+
+    def test_load_picks_up_external_changes(self, index_store: IndexStore, session_id: str) -> None:
+        """Test that the cached index is reloaded when the file changes.
+
+        Args:
+            index_store: The IndexStore fixture instance.
+            session_id: The test session ID fixture.
+        """
+        index_store.add_session(
+            session_id=session_id,
+            status="running",
+            created_at="2025-01-01T00:00:00.000Z",
+            last_activity_at="2025-01-01T00:00:00.000Z",
+        )
+        assert index_store.load() is index_store.load()
+
+        # Rewrite the file behind the store's back
+        data = json.loads(index_store.index_path.read_text(encoding="utf-8"))
+        data["sessions"] = []
+        index_store.index_path.write_text(json.dumps(data), encoding="utf-8")
+
+        assert index_store.load()["sessions"] == []
+
+    def test_get_all_sessions_sorts_unordered_file(self, index_store: IndexStore) -> None:
+        """Test that an index written out of order is still returned sorted.
+
+        Args:
+            index_store: The IndexStore fixture instance.
+        """
+        entries = [
+            {
+                "sessionId": f"session-{day}",
+                "status": "exited",
+                "createdAt": f"2025-01-0{day}T00:00:00.000Z",
+                "lastActivityAt": f"2025-01-0{day}T00:00:00.000Z",
+                "name": None,
+            }
+            for day in (2, 3, 1)
+        ]
+        index_store.index_path.write_text(
+            json.dumps({"protocolVersion": 1, "updatedAt": "", "sessions": entries}),
+            encoding="utf-8",
+        )
+
+        sessions = index_store.get_all_sessions()
+        assert [s.sessionId for s in sessions] == ["session-3", "session-2", "session-1"]
+
+    @pytest.mark.asyncio
+    async def test_mutations_coalesce_in_event_loop(self, index_store: IndexStore) -> None:
+        """Test that mutations inside an event loop are written once on flush.
+
+        Args:
+            index_store: The IndexStore fixture instance.
+        """
+        for i in range(2):
+            index_store.add_session(
+                session_id=f"12345678-1234-1234-1234-12345678900{i}",
+                status="running",
+                created_at="2025-01-01T00:00:00.000Z",
+                last_activity_at="2025-01-01T00:00:00.000Z",
+            )
+
+        # Pending changes are visible before they reach disk
+        assert not index_store.index_path.exists()
+        assert len(index_store.get_all_sessions()) == 2
+
+        index_store.flush()
+
+        data = json.loads(index_store.index_path.read_text(encoding="utf-8"))
+        assert len(data["sessions"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_pending_mutations(
+        self, index_store: IndexStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a failed write leaves batched mutations for the next flush.
+
+        Args:
+            index_store: The IndexStore fixture instance.
+            monkeypatch: Pytest fixture for patching the atomic writer.
+        """
+        index_store.add_session(
+            session_id="12345678-1234-1234-1234-123456789000",
+            status="running",
+            created_at="2025-01-01T00:00:00.000Z",
+            last_activity_at="2025-01-01T00:00:00.000Z",
+        )
+
+        real_write = index_store_module.atomic_write_json
+        calls = []
+
+        def fail_once(*args: Any, **kwargs: Any) -> None:
+            calls.append(args)
+            if len(calls) == 1:
+                raise OSError("disk full")
+            real_write(*args, **kwargs)
+
+        monkeypatch.setattr(index_store_module, "atomic_write_json", fail_once)
+
+        with pytest.raises(OSError):
+            index_store.flush()
+        assert len(index_store.get_all_sessions()) == 1
+
+        index_store.flush()
+
+        data = json.loads(index_store.index_path.read_text(encoding="utf-8"))
+        assert [s["sessionId"] for s in data["sessions"]] == [
+            "12345678-1234-1234-1234-123456789000"
+        ]
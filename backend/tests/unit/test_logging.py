@@ -1,25 +1,35 @@
 """Unit tests for logging setup."""
 import pytest
 from pathlib import Path
-import os
+import json
 import logging
+import logging.handlers
+import os
 
-from app.logging_setup import setup_logging, get_logger, CustomJsonFormatter
+from app import logging_setup
+from app.logging_setup import (
+    setup_logging,
+    get_logger,
+    CustomJsonFormatter,
+    close_fast_log,
+    fast_emit,
+)
 
 
 class TestLoggingSetup:
     """Tests for logging setup functionality."""
 
     @pytest.fixture(autouse=True)
-    def setup(self, tmp_path: Path) -> None:
+    def setup(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         """Set up test environment.
 
         Args:
             tmp_path: Pytest fixture providing a temporary directory unique to the test.
+            monkeypatch: Pytest fixture for setting environment variables.
         """
-        os.environ["DATA_DIR"] = str(tmp_path / "data")
-        os.environ["LOG_FILE"] = str(tmp_path / "data" / "logs" / "app.jsonl")
-        os.environ["LOG_LEVEL"] = "DEBUG"
+        monkeypatch.setenv("DATA_DIR", str(tmp_path / "data"))
+        monkeypatch.setenv("LOG_FILE", str(tmp_path / "data" / "logs" / "app.jsonl"))
+        monkeypatch.setenv("LOG_LEVEL", "DEBUG")
         
         (tmp_path / "data" / "logs").mkdir(parents=True, exist_ok=True)
 
@@ -61,3 +71,82 @@ class TestLoggingSetup:
         assert "event" in log_record
         assert log_record["level"] == "INFO"
         assert log_record["event"] == "test"
+
+    def test_custom_json_formatter_format(self) -> None:
+        """Test CustomJsonFormatter serializes records as JSON.
+
+        Verifies that extra fields the encoder does not know are written
+        as strings rather than failing the log call.
+        """
+        formatter = CustomJsonFormatter("%(ts)s %(level)s %(event)s %(message)s")
+
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg="Test message",
+            args=(),
+            exc_info=None,
+        )
+        record.path = Path("logs")
+
+        entry = json.loads(formatter.format(record))
+
+        assert entry["level"] == "INFO"
+        assert entry["message"] == "Test message"
+        assert entry["path"] == "logs"
+
+    def test_fast_emit(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test fast_emit appends JSON lines and respects the log level.
+
+        Args:
+            tmp_path: Pytest fixture providing a temporary directory unique to the test.
+            monkeypatch: Pytest fixture for replacing the module's log descriptor and console.
+        """
+        log_file = tmp_path / "fast.jsonl"
+        fd = os.open(log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT)
+        monkeypatch.setattr(logging_setup, "_fast_fd", fd)
+        monkeypatch.setattr(logging_setup, "_fast_level", logging.INFO)
+        console = logging.handlers.BufferingHandler(capacity=10)
+        monkeypatch.setattr(logging_setup, "_fast_console", console)
+        try:
+            fast_emit("test", "dropped", clientId="c1")
+            fast_emit("test", "kept", level=logging.INFO, clientId="c1")
+        finally:
+            close_fast_log()
+
+        assert logging_setup._fast_fd is None
+        assert [r.getMessage() for r in console.buffer] == ["kept"]
+        assert console.buffer[0].name == "test"
+
+        lines = log_file.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 1
+        entry = json.loads(lines[0])
+        assert entry["level"] == "INFO"
+        assert entry["event"] == "test"
+        assert entry["message"] == "kept"
+        assert entry["clientId"] == "c1"
+
+    @pytest.mark.parametrize("field", ["ts", "asctime", "name", "msg"])
+    def test_fast_emit_rejects_reserved_fields(
+        self, field: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test fast_emit refuses fields that would clobber the entry or record.
+
+        Args:
+            field: Reserved field name passed as an extra field.
+            tmp_path: Pytest fixture providing a temporary directory unique to the test.
+            monkeypatch: Pytest fixture for replacing the module's log descriptor.
+        """
+        log_file = tmp_path / "fast.jsonl"
+        fd = os.open(log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT)
+        monkeypatch.setattr(logging_setup, "_fast_fd", fd)
+        monkeypatch.setattr(logging_setup, "_fast_level", logging.DEBUG)
+        try:
+            with pytest.raises(KeyError):
+                fast_emit("test", "msg", **{field: "x"})
+        finally:
+            close_fast_log()
+
+        assert log_file.read_text(encoding="utf-8") == ""
@@ -1,7 +1,10 @@
 """Unit tests for meta store."""
+import json
 import pytest
 from pathlib import Path
+from typing import Any
 
+from app.persistence import meta_store as meta_store_module
 from app.persistence.meta_store import MetaStore, SessionMeta
 
 
@@ -20,15 +23,6 @@ class TestMetaStore:
         """
         return MetaStore(base_path=tmp_path / "sessions")
 
-    @pytest.fixture
-    def session_id(self) -> str:
-        """Provide a test session ID.
-
-        Returns:
-            A valid UUID string for use as a session identifier in tests.
-        """
-        return "12345678-1234-1234-1234-123456789abc"
-
     def test_create_meta(self, meta_store: MetaStore, session_id: str) -> None:
         """Test creating session metadata.
 
@@ -97,6 +91,66 @@ class TestMetaStore:
         assert loaded.sessionId == session_id
         assert loaded.pid == 12345
 
+    def test_save_does_not_alias_caller_meta(
+        self, meta_store: MetaStore, session_id: str
+    ) -> None:
+        """Test that mutating a saved meta afterwards doesn't leak into the cache.
+
+        Args:
+            meta_store: The MetaStore fixture instance.
+            session_id: The test session ID fixture.
+        """
+        meta = meta_store.create(
+            session_id=session_id,
+            workspace_path="C:\\test\\workspace",
+            copilot_path="copilot.exe",
+            pid=12345,
+            cols=120,
+            rows=30,
+        )
+        meta.status = "exited"
+        meta_store.save(meta)
+        meta.cols = 80
+
+        loaded = meta_store.load(session_id)
+        assert loaded is not None
+        assert loaded.status == "exited"
+        assert loaded.cols == 120
+
+    def test_load_meta_ignores_unknown_keys(
+        self, meta_store: MetaStore, session_id: str
+    ) -> None:
+        """Test loading a meta.json that carries fields this version doesn't know.
+
+        Args:
+            meta_store: The MetaStore fixture instance.
+            session_id: The test session ID fixture.
+        """
+        meta_path = meta_store._get_meta_path(session_id)
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        meta_path.write_text(
+            json.dumps(
+                {
+                    "sessionId": session_id,
+                    "status": "running",
+                    "createdAt": "2025-01-01T00:00:00.000Z",
+                    "lastActivityAt": "2025-01-01T00:00:00.000Z",
+                    "workspacePath": "C:\\test\\workspace",
+                    "pid": 12345,
+                    "cols": 120,
+                    "rows": 30,
+                    "copilotPath": "copilot.exe",
+                    "futureField": "ignored",
+                }
+            ),
+            encoding="utf-8",
+        )
+
+        loaded = meta_store.load(session_id)
+        assert loaded is not None
+        assert loaded.sessionId == session_id
+        assert loaded.cols == 120
+
     def test_load_meta_not_found(self, meta_store: MetaStore) -> None:
         """Test loading non-existent metadata returns None.
 
@@ -177,3 +231,110 @@ class TestMetaStore:
         assert loaded is not None
         assert loaded.cols == 80
         assert loaded.rows == 24
+
+    def test_updates_persist_to_disk(
+        self, meta_store: MetaStore, session_id: str, tmp_path: Path
+    ) -> None:
+        """Test that cached updates are written through to a fresh store.
+
+        Args:
+            meta_store: The MetaStore fixture instance.
+            session_id: The test session ID fixture.
+            tmp_path: Pytest fixture providing the store's temporary directory.
+        """
+        meta_store.create(
+            session_id=session_id,
+            workspace_path="C:\\test\\workspace",
+            copilot_path="copilot.exe",
+            pid=12345,
+            cols=120,
+            rows=30,
+        )
+
+        meta_store.update_dimensions(session_id, 80, 24)
+
+        loaded = MetaStore(base_path=tmp_path / "sessions").load(session_id)
+        assert loaded is not None
+        assert loaded.cols == 80
+        assert loaded.rows == 24
+
+    @pytest.mark.asyncio
+    async def test_activity_updates_coalesce_in_event_loop(
+        self, meta_store: MetaStore, session_id: str, tmp_path: Path
+    ) -> None:
+        """Test that activity updates inside an event loop are written on flush.
+
+        Args:
+            meta_store: The MetaStore fixture instance.
+            session_id: The test session ID fixture.
+            tmp_path: Pytest fixture providing the store's temporary directory.
+        """
+        meta_store.create(
+            session_id=session_id,
+            workspace_path="C:\\test\\workspace",
+            copilot_path="copilot.exe",
+            pid=12345,
+            cols=120,
+            rows=30,
+        )
+        meta_path = tmp_path / "sessions" / session_id / "meta.json"
+        on_disk = meta_path.read_bytes()
+
+        meta_store.update_activity(session_id)
+        meta_store.update_activity(session_id)
+
+        assert meta_path.read_bytes() == on_disk
+        loaded = meta_store.load(session_id)
+        assert loaded is not None
+
+        meta_store.flush()
+
+        reloaded = MetaStore(base_path=tmp_path / "sessions").load(session_id)
+        assert reloaded is not None
+        assert reloaded.lastActivityAt == loaded.lastActivityAt
+
+    @pytest.mark.asyncio
+    async def test_flush_failure_keeps_other_sessions_and_rearms(
+        self, meta_store: MetaStore, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that one session's failed write doesn't block the rest.
+
+        Args:
+            meta_store: The MetaStore fixture instance.
+            tmp_path: Pytest fixture providing the store's temporary directory.
+            monkeypatch: Pytest fixture for patching the atomic writer.
+        """
+        failing = "12345678-1234-1234-1234-000000000001"
+        healthy = "12345678-1234-1234-1234-000000000002"
+        for sid in (failing, healthy):
+            meta_store.create(
+                session_id=sid,
+                workspace_path="C:\\test\\workspace",
+                copilot_path="copilot.exe",
+                pid=12345,
+                cols=120,
+                rows=30,
+            )
+            meta_store.update_activity(sid)
+
+        real_write = meta_store_module.atomic_write_json
+
+        def fail_for_one(path: Path, data: dict[str, Any], **kwargs: Any) -> None:
+            if data["sessionId"] == failing:
+                raise OSError("disk full")
+            real_write(path, data, **kwargs)
+
+        monkeypatch.setattr(meta_store_module, "atomic_write_json", fail_for_one)
+        meta_store.flush()
+
+        assert meta_store._dirty == {failing}
+        assert meta_store._flush_handle is not None
+        fresh = MetaStore(base_path=tmp_path / "sessions")
+        assert fresh.load(healthy) == meta_store.load(healthy)
+
+        monkeypatch.setattr(meta_store_module, "atomic_write_json", real_write)
+        meta_store.flush()
+
+        assert not meta_store._dirty
+        fresh = MetaStore(base_path=tmp_path / "sessions")
+        assert fresh.load(failing) == meta_store.load(failing)
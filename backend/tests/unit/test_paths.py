@@ -1,6 +1,7 @@
 """Unit tests for path utilities."""
 import pytest
 from pathlib import Path
+from collections.abc import Callable
 import os
 
 from app.util.paths import (
@@ -18,66 +19,35 @@ from app.config import settings
 class TestPathUtilities:
     """Tests for path utility functions."""
 
-    @pytest.fixture
-    def session_id(self) -> str:
-        """Provide a test session ID.
-
-        Returns:
-            str: A valid UUID-formatted session ID for testing.
-        """
-        return "12345678-1234-1234-1234-123456789abc"
-
-    def test_get_session_dir(self, session_id: str) -> None:
-        """Test getting session directory path.
-
-        Args:
-            session_id: The session ID fixture.
-
-        Verifies:
-            The returned path contains the session ID and ends with it.
-        """
-        path = get_session_dir(session_id)
-        assert session_id in str(path)
-        assert str(path).endswith(session_id)
-
-    def test_get_workspace_path(self, session_id: str) -> None:
-        """Test getting workspace directory path.
-
-        Args:
-            session_id: The session ID fixture.
-
-        Verifies:
-            The returned path contains the session ID and ends with 'workspace'.
-        """
-        path = get_workspace_path(session_id)
-        assert session_id in str(path)
-        assert str(path).endswith("workspace")
-
-    def test_get_meta_path(self, session_id: str) -> None:
-        """Test getting meta.json path.
-
-        Args:
-            session_id: The session ID fixture.
-
-        Verifies:
-            The returned path contains the session ID and ends with 'meta.json'.
-        """
-        path = get_meta_path(session_id)
-        assert session_id in str(path)
-        assert str(path).endswith("meta.json")
-
-    def test_get_transcript_path(self, session_id: str) -> None:
-        """Test getting transcript.jsonl path.
+    @pytest.mark.parametrize(
+        ("path_func", "suffix"),
+        [
+            (get_session_dir, None),
+            (get_workspace_path, "workspace"),
+            (get_meta_path, "meta.json"),
+            (get_transcript_path, "transcript.jsonl"),
+        ],
+        ids=["session_dir", "workspace", "meta", "transcript"],
+    )
+    def test_session_path(
+        self, session_id: str, path_func: Callable[[str], Path], suffix: str | None
+    ) -> None:
+        """Test building per-session paths.
 
         Args:
             session_id: The session ID fixture.
+            path_func: Path helper under test.
+            suffix: Expected final path component; None means the session ID.
 
         Verifies:
-            The returned path contains the session ID and ends with 'transcript.jsonl'.
+            The path ends with the suffix, directly under the session directory.
         """
-        path = get_transcript_path(session_id)
-        assert session_id in str(path)
-        assert str(path).endswith("transcript.jsonl")
+        path = path_func(session_id)
+        if suffix is None:
+            assert path.name == session_id
+        else:
+            assert path.name == suffix
+            assert path.parent.name == session_id
 
     def test_get_index_path(self) -> None:
         """Test getting index.json path.
@@ -86,7 +56,7 @@ class TestPathUtilities:
             The returned path ends with 'index.json'.
         """
         path = get_index_path()
-        assert str(path).endswith("index.json")
+        assert path.name == "index.json"
 
     def test_workspace_path_under_session_dir(self, session_id: str) -> None:
         """Test that workspace path is under session directory.
@@ -99,43 +69,55 @@ class TestPathUtilities:
         """
         session_dir = get_session_dir(session_id)
         workspace = get_workspace_path(session_id)
-        assert session_dir in workspace.parents
+        session_parts = session_dir.parts
+        assert len(workspace.parts) > len(session_parts)
+        assert workspace.parts[: len(session_parts)] == session_parts
 
 
 class TestWorkspacePathValidation:
     """Tests for workspace path validation."""
 
-    @pytest.fixture
-    def session_id(self) -> str:
-        """Provide a test session ID.
+    @pytest.fixture(scope="module")
+    def malicious_path(self, session_id: str) -> Path:
+        """Provide a workspace path that escapes with '..' segments.
+
+        Args:
+            session_id: The session ID fixture.
+
+        Returns:
+            Path: A path resolving outside the session workspace.
+        """
+        return Path(f"data/sessions/{session_id}/workspace/../../../etc/passwd")
+
+    @pytest.fixture(scope="module")
+    def other_workspace(self) -> Path:
+        """Provide the workspace path of a different session.
 
         Returns:
-            str: A valid UUID-formatted session ID for testing.
+            Path: Workspace directory for another session ID.
         """
-        return "12345678-1234-1234-1234-123456789abc"
+        return get_workspace_path("other-session-id-1234567890123456")
 
-    def test_path_traversal_rejected(self, session_id: str) -> None:
+    def test_path_traversal_rejected(self, session_id: str, malicious_path: Path) -> None:
         """Test that path traversal attempts are rejected.
 
         Args:
             session_id: The session ID fixture.
+            malicious_path: Path escaping the workspace with '..'.
 
         Verifies:
             Paths containing '..' directory traversal are rejected as invalid.
         """
-        # Try to escape with ..
-        malicious_path = Path(f"data/sessions/{session_id}/workspace/../../../etc/passwd")
         assert not is_valid_workspace_path(malicious_path, session_id)
 
-    def test_different_session_rejected(self, session_id: str) -> None:
+    def test_different_session_rejected(self, session_id: str, other_workspace: Path) -> None:
         """Test that paths from different sessions are rejected.
 
         Args:
             session_id: The session ID fixture.
+            other_workspace: Workspace path of another session.
 
         Verifies:
             Workspace paths belonging to a different session are rejected.
         """
-        other_session = "other-session-id-1234567890123456"
-        path = get_workspace_path(other_session)
-        assert not is_valid_workspace_path(path, session_id)
+        assert not is_valid_workspace_path(other_workspace, session_id)
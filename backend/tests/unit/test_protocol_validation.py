@@ -1,6 +1,7 @@
 """Unit tests for WebSocket protocol message validation."""
+import re
 import pytest
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 from app.ws.protocol import (
     ClientMessage,
@@ -16,82 +17,76 @@ from app.ws.protocol import (
     SessionTerminateMessage,
     TerminalInputMessage,
     TerminalResizeMessage,
+    error_payload,
+    is_valid_session_id,
     utc_now_iso,
 )
+from tests.conftest import SESSION_ID
+
+# (id, raw message, expected model, expected field values), built once at import
+PARSE_CASES: list[tuple[str, dict[str, object], type[BaseModel], dict[str, object]]] = [
+    (
+        "session.create",
+        {"type": "session.create"},
+        SessionCreateMessage,
+        {"type": "session.create"},
+    ),
+    (
+        "session.attach",
+        {"type": "session.attach", "sessionId": SESSION_ID},
+        SessionAttachMessage,
+        {"sessionId": SESSION_ID},
+    ),
+    ("session.list", {"type": "session.list"}, SessionListMessage, {"type": "session.list"}),
+    (
+        "session.terminate",
+        {"type": "session.terminate", "sessionId": SESSION_ID},
+        SessionTerminateMessage,
+        {"sessionId": SESSION_ID},
+    ),
+    (
+        "term.in",
+        {"type": "term.in", "sessionId": SESSION_ID, "data": "hello\r\n"},
+        TerminalInputMessage,
+        {"data": "hello\r\n"},
+    ),
+    (
+        "term.resize",
+        {"type": "term.resize", "sessionId": SESSION_ID, "cols": 80, "rows": 24},
+        TerminalResizeMessage,
+        {"cols": 80, "rows": 24},
+    ),
+]
+
+# Expected utc_now_iso layout: YYYY-MM-DDTHH:MM:SS.sssZ
+_ISO_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z")
 
 
 class TestClientMessageParsing:
     """Tests for parsing client messages."""
 
-    def test_parse_session_create(self) -> None:
-        """Test parsing session.create message.
-
-        Verifies that a session.create message is correctly parsed into
-        a SessionCreateMessage instance with the expected type.
-        """
-        data = {"type": "session.create"}
-        message = parse_client_message(data)
-        assert isinstance(message, SessionCreateMessage)
-        assert message.type == "session.create"
-
-    def test_parse_session_attach(self) -> None:
-        """Test parsing session.attach message.
-
-        Verifies that a session.attach message with a valid session ID
-        is correctly parsed into a SessionAttachMessage instance.
-        """
-        session_id = "12345678-1234-1234-1234-123456789abc"
-        data = {"type": "session.attach", "sessionId": session_id}
-        message = parse_client_message(data)
-        assert isinstance(message, SessionAttachMessage)
-        assert message.sessionId == session_id
-
-    def test_parse_session_list(self) -> None:
-        """Test parsing session.list message.
-
-        Verifies that a session.list message is correctly parsed into
-        a SessionListMessage instance.
+    @pytest.mark.parametrize(
+        ("data", "model", "expected"),
+        [case[1:] for case in PARSE_CASES],
+        ids=[case[0] for case in PARSE_CASES],
+    )
+    def test_parse_client_message(
+        self, data: dict[str, object], model: type[BaseModel], expected: dict[str, object]
+    ) -> None:
+        """Test parsing each client message type.
+
+        Verifies that a valid message is parsed into the model for its
+        type with the expected field values.
+
+        Args:
+            data: Raw message dictionary.
+            model: Expected message model class.
+            expected: Field values the parsed message must have.
         """
-        data = {"type": "session.list"}
         message = parse_client_message(data)
-        assert isinstance(message, SessionListMessage)
-
-    def test_parse_session_terminate(self) -> None:
-        """Test parsing session.terminate message.
-
-        Verifies that a session.terminate message with a valid session ID
-        is correctly parsed into a SessionTerminateMessage instance.
-        """
-        session_id = "12345678-1234-1234-1234-123456789abc"
-        data = {"type": "session.terminate", "sessionId": session_id}
-        message = parse_client_message(data)
-        assert isinstance(message, SessionTerminateMessage)
-        assert message.sessionId == session_id
-
-    def test_parse_term_in(self) -> None:
-        """Test parsing term.in message.
-
-        Verifies that a term.in message with session ID and data is
-        correctly parsed into a TerminalInputMessage instance.
-        """
-        session_id = "12345678-1234-1234-1234-123456789abc"
-        data = {"type": "term.in", "sessionId": session_id, "data": "hello\r\n"}
-        message = parse_client_message(data)
-        assert isinstance(message, TerminalInputMessage)
-        assert message.data == "hello\r\n"
-
-    def test_parse_term_resize(self) -> None:
-        """Test parsing term.resize message.
-
-        Verifies that a term.resize message with session ID and dimensions
-        is correctly parsed into a TerminalResizeMessage instance.
-        """
-        session_id = "12345678-1234-1234-1234-123456789abc"
-        data = {"type": "term.resize", "sessionId": session_id, "cols": 80, "rows": 24}
-        message = parse_client_message(data)
-        assert isinstance(message, TerminalResizeMessage)
-        assert message.cols == 80
-        assert message.rows == 24
+        assert isinstance(message, model)
+        for field, value in expected.items():
+            assert getattr(message, field) == value
 
     def test_parse_unknown_type_raises(self) -> None:
         """Test that unknown message type raises ValueError.
@@ -134,28 +129,57 @@ class TestMessageValidation:
         with pytest.raises(ValidationError):
             SessionAttachMessage(type="session.attach", sessionId="short")
 
-    def test_term_in_requires_data(self) -> None:
+    def test_session_attach_rejects_non_uuid_session_id(self) -> None:
+        """Test that a 36-character sessionId must still be a UUID.
+
+        Verifies that path-like ids of the right length are rejected.
+        """
+        bad_id = "../../../../../../../../../etc/passw"
+        assert len(bad_id) == 36
+        with pytest.raises(ValidationError):
+            SessionAttachMessage(type="session.attach", sessionId=bad_id)
+
+    def test_is_valid_session_id(self, session_id: str) -> None:
+        """Test the cached session id check.
+
+        Verifies that canonical UUIDs pass and other strings fail.
+
+        Args:
+            session_id: The test session ID fixture.
+        """
+        assert is_valid_session_id(session_id)
+        assert not is_valid_session_id(session_id + "d")
+        assert not is_valid_session_id(session_id[:-1] + "g")
+        assert not is_valid_session_id(session_id + "\n")
+
+    def test_term_in_requires_data(self, session_id: str) -> None:
         """Test that term.in requires data field.
 
         Verifies that TerminalInputMessage raises ValidationError when
         the required data field is missing from the message.
+
+        Args:
+            session_id: The test session ID fixture.
         """
         with pytest.raises(ValidationError):
             TerminalInputMessage(
                 type="term.in",
-                sessionId="12345678-1234-1234-1234-123456789abc",
+                sessionId=session_id,
             )  # type: ignore
 
-    def test_term_resize_requires_positive_dimensions(self) -> None:
+    def test_term_resize_requires_positive_dimensions(self, session_id: str) -> None:
         """Test that resize requires positive dimensions.
 
         Verifies that TerminalResizeMessage raises ValidationError when
         cols or rows are zero or negative values.
+
+        Args:
+            session_id: The test session ID fixture.
         """
         with pytest.raises(ValidationError):
             TerminalResizeMessage(
                 type="term.resize",
-                sessionId="12345678-1234-1234-1234-123456789abc",
+                sessionId=session_id,
                 cols=0,
                 rows=24,
             )
@@ -188,14 +212,28 @@ class TestServerMessages:
         assert msg.type == "error"
         assert msg.code == "SESSION_NOT_FOUND"
 
-    def test_session_created_message(self) -> None:
+    def test_error_payload_matches_error_message(self) -> None:
+        """Test that error_payload builds the ErrorMessage wire shape.
+
+        Verifies the plain dict used on hot error paths equals the
+        serialized ErrorMessage model.
+        """
+        payload = error_payload(ErrorCodes.SESSION_NOT_FOUND, "Session not found")
+        assert payload == ErrorMessage(
+            code=ErrorCodes.SESSION_NOT_FOUND, message="Session not found"
+        ).model_dump()
+
+    def test_session_created_message(self, session_id: str) -> None:
         """Test SessionCreatedMessage creation.
 
         Verifies that SessionCreatedMessage is created with the correct
         type and properly embeds the session info object.
+
+        Args:
+            session_id: The test session ID fixture.
         """
         session_info = SessionInfo(
-            sessionId="12345678-1234-1234-1234-123456789abc",
+            sessionId=session_id,
             status="running",
             createdAt="2025-01-01T00:00:00.000Z",
             lastActivityAt="2025-01-01T00:00:00.000Z",
@@ -219,12 +257,5 @@ class TestUtcNowIso:
         format: YYYY-MM-DDTHH:MM:SS.sssZ (24 characters with Z suffix).
         """
         ts = utc_now_iso()
-        assert ts.endswith("Z")
-        # Should match pattern: YYYY-MM-DDTHH:MM:SS.sssZ
         assert len(ts) == 24
-        assert ts[4] == "-"
-        assert ts[7] == "-"
-        assert ts[10] == "T"
-        assert ts[13] == ":"
-        assert ts[16] == ":"
-        assert ts[19] == "."
+        assert _ISO_RE.fullmatch(ts)
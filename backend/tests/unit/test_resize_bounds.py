@@ -8,35 +8,41 @@ from app.config import Settings
 class TestResizeBounds:
     """Tests for resize bounds validation."""
 
-    def test_default_bounds(self) -> None:
+    def test_default_bounds(self, settings: Settings) -> None:
         """Test default resize bounds are set correctly.
 
         Verifies that the Settings class initializes with the expected
         default minimum and maximum values for columns and rows.
+
+        Args:
+            settings: The Settings fixture instance.
         """
-        settings = Settings()
         assert settings.MIN_COLS == 20
         assert settings.MAX_COLS == 300
         assert settings.MIN_ROWS == 5
         assert settings.MAX_ROWS == 120
 
-    def test_initial_dimensions(self) -> None:
+    def test_initial_dimensions(self, settings: Settings) -> None:
         """Test initial terminal dimensions.
 
         Verifies that the Settings class initializes with the expected
         default values for initial columns and rows.
+
+        Args:
+            settings: The Settings fixture instance.
         """
-        settings = Settings()
         assert settings.INITIAL_COLS == 120
         assert settings.INITIAL_ROWS == 30
 
-    def test_initial_within_bounds(self) -> None:
+    def test_initial_within_bounds(self, settings: Settings) -> None:
         """Test that initial dimensions are within bounds.
 
         Verifies that the default initial column and row values fall
         within the configured minimum and maximum bounds.
+
+        Args:
+            settings: The Settings fixture instance.
         """
-        settings = Settings()
         assert settings.MIN_COLS <= settings.INITIAL_COLS <= settings.MAX_COLS
         assert settings.MIN_ROWS <= settings.INITIAL_ROWS <= settings.MAX_ROWS
 
@@ -44,74 +50,65 @@ class TestResizeBounds:
 class TestResizeValidation:
     """Tests for resize value validation logic."""
 
-    @pytest.fixture
-    def settings(self) -> Settings:
-        """Get settings instance.
-
-        Returns:
-            Settings: A new Settings instance for testing.
-        """
-        return Settings()
-
-    def test_valid_cols_range(self, settings: Settings) -> None:
+    @pytest.mark.parametrize("cols", [20, 80, 120, 200, 300])
+    def test_valid_cols_range(self, settings: Settings, cols: int) -> None:
         """Test valid column values.
 
         Args:
             settings: The Settings fixture instance.
+            cols: Column count to check.
         """
-        valid_cols = [20, 80, 120, 200, 300]
-        for cols in valid_cols:
-            assert settings.MIN_COLS <= cols <= settings.MAX_COLS
+        assert settings.MIN_COLS <= cols <= settings.MAX_COLS
 
-    def test_invalid_cols_below_min(self, settings: Settings) -> None:
+    @pytest.mark.parametrize("cols", [0, 1, 10, 19])
+    def test_invalid_cols_below_min(self, settings: Settings, cols: int) -> None:
         """Test columns below minimum are invalid.
 
         Args:
             settings: The Settings fixture instance.
+            cols: Column count to check.
         """
-        invalid_cols = [0, 1, 10, 19]
-        for cols in invalid_cols:
-            assert cols < settings.MIN_COLS
+        assert cols < settings.MIN_COLS
 
-    def test_invalid_cols_above_max(self, settings: Settings) -> None:
+    @pytest.mark.parametrize("cols", [301, 400, 1000])
+    def test_invalid_cols_above_max(self, settings: Settings, cols: int) -> None:
         """Test columns above maximum are invalid.
 
         Args:
             settings: The Settings fixture instance.
+            cols: Column count to check.
         """
-        invalid_cols = [301, 400, 1000]
-        for cols in invalid_cols:
-            assert cols > settings.MAX_COLS
+        assert cols > settings.MAX_COLS
 
-    def test_valid_rows_range(self, settings: Settings) -> None:
+    @pytest.mark.parametrize("rows", [5, 24, 30, 50, 120])
+    def test_valid_rows_range(self, settings: Settings, rows: int) -> None:
         """Test valid row values.
 
         Args:
             settings: The Settings fixture instance.
+            rows: Row count to check.
         """
-        valid_rows = [5, 24, 30, 50, 120]
-        for rows in valid_rows:
-            assert settings.MIN_ROWS <= rows <= settings.MAX_ROWS
+        assert settings.MIN_ROWS <= rows <= settings.MAX_ROWS
 
-    def test_invalid_rows_below_min(self, settings: Settings) -> None:
+    @pytest.mark.parametrize("rows", [0, 1, 2, 4])
+    def test_invalid_rows_below_min(self, settings: Settings, rows: int) -> None:
         """Test rows below minimum are invalid.
 
         Args:
             settings: The Settings fixture instance.
+            rows: Row count to check.
         """
-        invalid_rows = [0, 1, 2, 4]
-        for rows in invalid_rows:
-            assert rows < settings.MIN_ROWS
+        assert rows < settings.MIN_ROWS
 
-    def test_invalid_rows_above_max(self, settings: Settings) -> None:
+    @pytest.mark.parametrize("rows", [121, 200, 500])
+    def test_invalid_rows_above_max(self, settings: Settings, rows: int) -> None:
         """Test rows above maximum are invalid.
 
         Args:
             settings: The Settings fixture instance.
+            rows: Row count to check.
         """
-        invalid_rows = [121, 200, 500]
-        for rows in invalid_rows:
-            assert rows > settings.MAX_ROWS
+        assert rows > settings.MAX_ROWS
 
     def test_boundary_values(self, settings: Settings) -> None:
         """Test exact boundary values.
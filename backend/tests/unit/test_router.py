@@ -0,0 +1,59 @@
+"""Unit tests for WebSocket connection handling."""
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from starlette.websockets import WebSocketState
+
+from app.ws.protocol import TerminalOutputMessage
+from app.ws.router import WebSocketConnection
+
+
+class TestWebSocketConnection:
+    """Tests for WebSocketConnection output handling."""
+
+    @pytest.fixture
+    def conn(self) -> WebSocketConnection:
+        """Create a connection backed by a connected mock WebSocket.
+
+        Returns:
+            WebSocketConnection: A connection with client ID 'client-1'.
+        """
+        websocket = MagicMock()
+        websocket.client_state = WebSocketState.CONNECTED
+        websocket.send_text = AsyncMock()
+        return WebSocketConnection(websocket, "client-1")
+
+    @pytest.mark.asyncio
+    async def test_handle_output_matches_protocol_model(
+        self, conn: WebSocketConnection, session_id: str
+    ) -> None:
+        """Test that pre-encoded term.out frames match the protocol model.
+
+        Args:
+            conn: The WebSocketConnection fixture instance.
+            session_id: The test session ID fixture.
+        """
+        data = 'line "one"\r\n\x1b[0m✓'
+        conn.attach_to_session(session_id)
+
+        await conn.handle_output(session_id, data)
+
+        sent = json.loads(conn.websocket.send_text.call_args.args[0])
+        assert sent == TerminalOutputMessage(sessionId=session_id, data=data).model_dump()
+
+    @pytest.mark.asyncio
+    async def test_handle_output_ignores_other_sessions(
+        self, conn: WebSocketConnection, session_id: str
+    ) -> None:
+        """Test that output for a session the connection is not attached to is dropped.
+
+        Args:
+            conn: The WebSocketConnection fixture instance.
+            session_id: The test session ID fixture.
+        """
+        conn.attach_to_session(session_id)
+
+        await conn.handle_output("87654321-4321-4321-4321-cba987654321", "data")
+
+        conn.websocket.send_text.assert_not_called()
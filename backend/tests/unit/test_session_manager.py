@@ -1,34 +1,71 @@
 """Unit tests for session manager."""
+import inspect
 import pytest
-from pathlib import Path
-import os
-
+import pytest_asyncio
+from collections.abc import AsyncIterator, Iterator
+from unittest.mock import MagicMock
+
+from app.config import settings
+from app.persistence.index_store import IndexStore
+from app.persistence.meta_store import MetaStore
+from app.persistence.transcript_store import TranscriptStore
+from app.sessions import manager as manager_module
 from app.sessions.manager import SessionManager
 from app.ws.protocol import ErrorCodes
 
 
-class TestSessionManager:
-    """Tests for SessionManager functionality."""
+@pytest.fixture(scope="module")
+def manager(tmp_path_factory: pytest.TempPathFactory) -> Iterator[SessionManager]:
+    """Create one SessionManager with mock PTY for every test in the module.
 
-    @pytest.fixture
-    def manager(self, tmp_path: Path) -> SessionManager:
-        """Create a SessionManager with mock PTY.
+    The manager persists through module-level stores, so those are replaced
+    with fresh stores under a temporary data directory for the module's
+    lifetime, and settings.DATA_DIR is pointed there for workspace paths.
 
-        Args:
-            tmp_path: Pytest fixture providing a temporary directory path.
+    Args:
+        tmp_path_factory: Pytest fixture for creating temporary directories.
 
-        Returns:
-            A SessionManager instance configured with mock PTY for testing.
-        """
-        # Set environment variable for DATA_DIR
-        os.environ["DATA_DIR"] = str(tmp_path / "data")
-        
-        # Create directories
-        (tmp_path / "data" / "sessions").mkdir(parents=True, exist_ok=True)
+    Yields:
+        A SessionManager instance configured with mock PTY for testing.
+    """
+    data_dir = tmp_path_factory.mktemp("manager") / "data"
+    sessions_dir = data_dir / "sessions"
+    sessions_dir.mkdir(parents=True, exist_ok=True)
+
+    meta_store = MetaStore(base_path=sessions_dir)
+    index_store = IndexStore(index_path=sessions_dir / "index.json")
+    transcript_store = TranscriptStore(base_path=sessions_dir)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(settings, "DATA_DIR", data_dir)
+        mp.setattr(manager_module, "meta_store", meta_store)
+        mp.setattr(manager_module, "index_store", index_store)
+        mp.setattr(manager_module, "transcript_store", transcript_store)
+        yield SessionManager(use_mock_pty=True)
+        meta_store.flush()
+        index_store.flush()
+        transcript_store.close()
 
-        return SessionManager(use_mock_pty=True)
 
-    @pytest.mark.asyncio
+# The manager and its PTY tasks outlive each test, so every async test and
+# this cleanup run on the one session-wide event loop
+@pytest_asyncio.fixture(autouse=True, loop_scope="session")
+async def cleanup_sessions(manager: SessionManager) -> AsyncIterator[None]:
+    """Terminate every session a test created, on the shared event loop.
+
+    Args:
+        manager: The shared SessionManager fixture.
+
+    Yields:
+        None: Control is yielded to the test.
+    """
+    yield
+    await manager.shutdown()
+
+
+class TestSessionManager:
+    """Tests for SessionManager functionality."""
+
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_create_session_success(self, manager: SessionManager) -> None:
         """Test successful session creation.
 
@@ -43,7 +80,7 @@ class TestSessionManager:
         assert session.is_running
         assert session.pty.pid is not None
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_create_session_max_sessions(
         self, manager: SessionManager, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -71,7 +108,7 @@ class TestSessionManager:
         assert error_code == ErrorCodes.MAX_SESSIONS_REACHED
         assert "Maximum running sessions" in (error_msg or "")
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_get_session(self, manager: SessionManager) -> None:
         """Test getting a session by ID.
 
@@ -85,7 +122,7 @@ class TestSessionManager:
         assert session is not None
         assert session.session_id == created.session_id
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_get_session_not_found(self, manager: SessionManager) -> None:
         """Test getting a non-existent session returns None.
 
@@ -95,7 +132,7 @@ class TestSessionManager:
         session = manager.get_session("nonexistent-id-1234567890123456")
         assert session is None
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_attach_session(self, manager: SessionManager) -> None:
         """Test attaching to a session.
 
@@ -113,21 +150,28 @@ class TestSessionManager:
         assert error_code is None
         assert "client-1" in session.attached_clients
 
-    @pytest.mark.asyncio
-    async def test_attach_session_not_found(self, manager: SessionManager) -> None:
-        """Test attaching to a non-existent session.
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_attach_session_malformed_id_skips_disk(
+        self, manager: SessionManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a malformed session id is rejected without reading meta.json.
 
         Args:
             manager: SessionManager fixture with mock PTY.
+            monkeypatch: Pytest fixture for patching the meta store.
         """
+        load = MagicMock(return_value=None)
+        monkeypatch.setattr(manager_module.meta_store, "load", load)
+
         session, error_code, error_msg = await manager.attach_session(
-            "nonexistent-id-1234567890123456", "client-1"
+            "../../outside-session-dir", "client-1"
         )
 
         assert session is None
         assert error_code == ErrorCodes.SESSION_NOT_FOUND
+        load.assert_not_called()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_terminate_session(self, manager: SessionManager) -> None:
         """Test terminating a session.
 
@@ -144,20 +188,23 @@ class TestSessionManager:
         assert error_code is None
         assert not created.is_running
 
-    @pytest.mark.asyncio
-    async def test_terminate_session_not_found(self, manager: SessionManager) -> None:
-        """Test terminating a non-existent session.
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_natural_exit_closes_transcript(self, manager: SessionManager) -> None:
+        """Test that a process exiting on its own releases its transcript handle.
 
         Args:
             manager: SessionManager fixture with mock PTY.
         """
-        exit_code, error_code, error_msg = await manager.terminate_session(
-            "nonexistent-id-1234567890123456"
-        )
+        created, _, _ = await manager.create_session()
+        assert created is not None
+        assert created.session_id in manager_module.transcript_store._files
 
-        assert error_code == ErrorCodes.SESSION_NOT_FOUND
+        created.pty.terminate()
+        await created.pty._handle_exit()
 
-    @pytest.mark.asyncio
+        assert created.session_id not in manager_module.transcript_store._files
+
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_send_input_success(self, manager: SessionManager) -> None:
         """Test sending input to a session.
 
@@ -174,7 +221,7 @@ class TestSessionManager:
         assert success
         assert error_code is None
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_send_input_too_large(
         self, manager: SessionManager, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -199,140 +246,84 @@ class TestSessionManager:
         assert not success
         assert error_code == ErrorCodes.INPUT_TOO_LARGE
 
-    def test_send_input_session_not_found(self, manager: SessionManager) -> None:
-        """Test sending input to non-existent session.
+    @pytest.mark.parametrize(
+        ("method", "args"),
+        [
+            ("attach_session", ("client-1",)),
+            ("terminate_session", ()),
+            ("send_input", ("test",)),
+            ("resize_session", (80, 24)),
+        ],
+        ids=["attach", "terminate", "send_input", "resize"],
+    )
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_session_not_found(
+        self, manager: SessionManager, method: str, args: tuple[object, ...]
+    ) -> None:
+        """Test that session operations report a non-existent session.
 
         Args:
             manager: SessionManager fixture with mock PTY.
+            method: Name of the SessionManager method to call.
+            args: Arguments following the session ID.
         """
-        success, error_code, error_msg = manager.send_input(
-            "nonexistent-id-1234567890123456", "test"
-        )
+        result = getattr(manager, method)("nonexistent-id-1234567890123456", *args)
+        if inspect.isawaitable(result):
+            result = await result
+        outcome, error_code, _ = result
 
-        assert not success
+        assert not outcome
         assert error_code == ErrorCodes.SESSION_NOT_FOUND
 
 
 class TestResizeSession:
     """Tests for session resize functionality."""
 
-    @pytest.fixture
-    def manager(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> SessionManager:
-        """Create a SessionManager with mock PTY and configured resize bounds.
-
-        Args:
-            tmp_path: Pytest fixture providing a temporary directory path.
-            monkeypatch: Pytest fixture for patching attributes.
+    @pytest.fixture(scope="class", autouse=True)
+    def resize_bounds(self) -> Iterator[None]:
+        """Pin the resize bounds once for every test in the class.
 
-        Returns:
-            A SessionManager instance configured with mock PTY and resize bounds.
+        Yields:
+            None: Control is yielded while the bounds are patched.
         """
         from app.config import settings
 
-        os.environ["DATA_DIR"] = str(tmp_path / "data")
-        monkeypatch.setattr(settings, "MIN_COLS", 20)
-        monkeypatch.setattr(settings, "MAX_COLS", 300)
-        monkeypatch.setattr(settings, "MIN_ROWS", 5)
-        monkeypatch.setattr(settings, "MAX_ROWS", 120)
-
-        (tmp_path / "data" / "sessions").mkdir(parents=True, exist_ok=True)
-
-        return SessionManager(use_mock_pty=True)
-
-    @pytest.mark.asyncio
-    async def test_resize_valid(self, manager: SessionManager) -> None:
-        """Test valid resize.
-
-        Args:
-            manager: SessionManager fixture with mock PTY.
-        """
-        created, _, _ = await manager.create_session()
-        assert created is not None
-
-        success, error_code, error_msg = manager.resize_session(
-            created.session_id, 80, 24
-        )
-
-        assert success
-        assert error_code is None
-
-    @pytest.mark.asyncio
-    async def test_resize_cols_below_min(self, manager: SessionManager) -> None:
-        """Test resize with columns below minimum.
-
-        Args:
-            manager: SessionManager fixture with mock PTY.
-        """
-        created, _, _ = await manager.create_session()
-        assert created is not None
-
-        success, error_code, error_msg = manager.resize_session(
-            created.session_id, 10, 24
-        )
-
-        assert not success
-        assert error_code == ErrorCodes.INVALID_RESIZE
-
-    @pytest.mark.asyncio
-    async def test_resize_cols_above_max(self, manager: SessionManager) -> None:
-        """Test resize with columns above maximum.
-
-        Args:
-            manager: SessionManager fixture with mock PTY.
-        """
-        created, _, _ = await manager.create_session()
-        assert created is not None
-
-        success, error_code, error_msg = manager.resize_session(
-            created.session_id, 400, 24
-        )
-
-        assert not success
-        assert error_code == ErrorCodes.INVALID_RESIZE
-
-    @pytest.mark.asyncio
-    async def test_resize_rows_below_min(self, manager: SessionManager) -> None:
-        """Test resize with rows below minimum.
-
-        Args:
-            manager: SessionManager fixture with mock PTY.
-        """
-        created, _, _ = await manager.create_session()
-        assert created is not None
-
-        success, error_code, error_msg = manager.resize_session(
-            created.session_id, 80, 2
-        )
-
-        assert not success
-        assert error_code == ErrorCodes.INVALID_RESIZE
-
-    @pytest.mark.asyncio
-    async def test_resize_rows_above_max(self, manager: SessionManager) -> None:
-        """Test resize with rows above maximum.
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(settings, "MIN_COLS", 20)
+            mp.setattr(settings, "MAX_COLS", 300)
+            mp.setattr(settings, "MIN_ROWS", 5)
+            mp.setattr(settings, "MAX_ROWS", 120)
+            yield
+
+    @pytest.mark.parametrize(
+        ("cols", "rows", "expected"),
+        [
+            (80, 24, None),
+            (10, 24, ErrorCodes.INVALID_RESIZE),
+            (400, 24, ErrorCodes.INVALID_RESIZE),
+            (80, 2, ErrorCodes.INVALID_RESIZE),
+            (80, 200, ErrorCodes.INVALID_RESIZE),
+        ],
+        ids=["valid", "cols_below_min", "cols_above_max", "rows_below_min", "rows_above_max"],
+    )
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_resize_bounds(
+        self, manager: SessionManager, cols: int, rows: int, expected: str | None
+    ) -> None:
+        """Test resize against the configured column and row bounds.
 
         Args:
             manager: SessionManager fixture with mock PTY.
+            cols: Requested column count.
+            rows: Requested row count.
+            expected: Expected error code, or None if the resize is valid.
         """
         created, _, _ = await manager.create_session()
         assert created is not None
 
         success, error_code, error_msg = manager.resize_session(
-            created.session_id, 80, 200
+            created.session_id, cols, rows
         )
 
-        assert not success
-        assert error_code == ErrorCodes.INVALID_RESIZE
-
-    def test_resize_session_not_found(self, manager: SessionManager) -> None:
-        """Test resize on non-existent session.
-
-        Args:
-            manager: SessionManager fixture with mock PTY.
-        """
-        success, error_code, error_msg = manager.resize_session(
-            "nonexistent-id-1234567890123456", 80, 24
-        )
-
-        assert not success
-        assert error_code == ErrorCodes.SESSION_NOT_FOUND
+        assert success == (expected is None)
+        assert error_code == expected
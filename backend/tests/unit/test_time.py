@@ -1,9 +1,13 @@
 """Unit tests for time utilities."""
+import re
 import pytest
 from datetime import datetime, timezone
 
 from app.util.time import utc_now_iso, parse_iso_timestamp
 
+# Expected utc_now_iso layout: YYYY-MM-DDTHH:MM:SS.sssZ
+_ISO_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z")
+
 
 class TestTimeUtilities:
     """Tests for time utility functions."""
@@ -17,13 +21,8 @@ class TestTimeUtilities:
             - Contains proper date/time separators
         """
         ts = utc_now_iso()
-        
-        assert ts.endswith("Z")
-        # Should match pattern: YYYY-MM-DDTHH:MM:SS.sssZ
         assert len(ts) == 24
-        assert ts[4] == "-"
-        assert ts[7] == "-"
-        assert ts[10] == "T"
+        assert _ISO_RE.fullmatch(ts)
 
     def test_utc_now_iso_is_utc(self) -> None:
         """Test that timestamp is in UTC.
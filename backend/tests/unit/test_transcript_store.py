@@ -1,7 +1,9 @@
 """Unit tests for transcript store."""
+import base64
 import json
 import pytest
 from pathlib import Path
+from collections.abc import Iterator
 
 from app.persistence.transcript_store import TranscriptStore
 
@@ -10,25 +12,18 @@ class TestTranscriptStore:
     """Tests for TranscriptStore functionality."""
 
     @pytest.fixture
-    def transcript_store(self, tmp_path: Path) -> TranscriptStore:
-        """Create a TranscriptStore with a temp path.
+    def transcript_store(self, tmp_path: Path) -> Iterator[TranscriptStore]:
+        """Create a TranscriptStore with a temp path, closing its files afterwards.
 
         Args:
             tmp_path: Pytest fixture providing a temporary directory path.
 
-        Returns:
+        Yields:
             A TranscriptStore instance configured with a temporary sessions path.
         """
-        return TranscriptStore(base_path=tmp_path / "sessions")
-
-    @pytest.fixture
-    def session_id(self) -> str:
-        """Provide a test session ID.
-
-        Returns:
-            A UUID-formatted string for use as a test session identifier.
-        """
-        return "12345678-1234-1234-1234-123456789abc"
+        store = TranscriptStore(base_path=tmp_path / "sessions")
+        yield store
+        store.close()
 
     def test_init_session(
         self, transcript_store: TranscriptStore, session_id: str
@@ -61,6 +56,24 @@ class TestTranscriptStore:
         assert events[0]["data"] == "Hello, world!"
         assert events[0]["seq"] == 1
 
+    def test_append_output_sync_bytes(
+        self, transcript_store: TranscriptStore, session_id: str
+    ) -> None:
+        """Test that raw output bytes are stored and read back as base64 text.
+
+        Args:
+            transcript_store: The TranscriptStore fixture instance.
+            session_id: The test session ID fixture.
+        """
+        data = b"\x1b[32mok\x1b[0m \xff\xfe\r\n"
+        transcript_store.init_session(session_id)
+        transcript_store.append_output_sync(session_id, data)
+
+        events = transcript_store.read_all_events(session_id)
+        assert events[0]["type"] == "out"
+        assert "data" not in events[0]
+        assert base64.b64decode(events[0]["data_b64"]) == data
+
     def test_append_input_sync(
         self, transcript_store: TranscriptStore, session_id: str
     ) -> None:
@@ -299,3 +312,121 @@ class TestTranscriptStore:
         # Each session should have seq=1
         assert events1[0]["seq"] == 1
         assert events2[0]["seq"] == 1
+
+    def test_read_all_events_cache_invalidated_on_append(
+        self, transcript_store: TranscriptStore, session_id: str
+    ) -> None:
+        """Test that cached reads are refreshed after appends and external writes.
+
+        Args:
+            transcript_store: The TranscriptStore fixture instance.
+            session_id: The test session ID fixture.
+        """
+        transcript_store.init_session(session_id)
+        transcript_store.append_output_sync(session_id, "first")
+
+        first = transcript_store.read_all_events(session_id)
+        first.clear()  # Callers get a copy, not the cached list
+        assert len(transcript_store.read_all_events(session_id)) == 1
+
+        transcript_store.append_output_sync(session_id, "second")
+        assert len(transcript_store.read_all_events(session_id)) == 2
+
+        transcript_path = transcript_store._get_transcript_path(session_id)
+        with open(transcript_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"type": "out", "data": "external"}) + "\n")
+        events = transcript_store.read_all_events(session_id)
+        assert [e["data"] for e in events] == ["first", "second", "external"]
+
+    @pytest.mark.asyncio
+    async def test_appends_coalesce_in_event_loop(
+        self, transcript_store: TranscriptStore, session_id: str
+    ) -> None:
+        """Test that appends inside an event loop are written together.
+
+        Args:
+            transcript_store: The TranscriptStore fixture instance.
+            session_id: The test session ID fixture.
+        """
+        transcript_store.init_session(session_id)
+        await transcript_store.append_output(session_id, "output 1")
+        transcript_store.append_input_sync(session_id, "input 1")
+
+        transcript_path = transcript_store._get_transcript_path(session_id)
+        assert transcript_path.stat().st_size == 0
+
+        transcript_store.flush()
+        lines = transcript_path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["seq"] for line in lines] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_pending_size_limit_forces_write(
+        self, tmp_path: Path, session_id: str
+    ) -> None:
+        """Test that a full buffer is written without waiting for the timer.
+
+        Args:
+            tmp_path: Pytest fixture providing a temporary directory path.
+            session_id: The test session ID fixture.
+        """
+        store = TranscriptStore(base_path=tmp_path / "sessions", max_pending_bytes=1024)
+        store.init_session(session_id)
+        await store.append_output(session_id, "x" * 1024)
+
+        transcript_path = store._get_transcript_path(session_id)
+        assert transcript_path.stat().st_size > 1024
+        store.close()
+
+    @pytest.mark.asyncio
+    async def test_close_session_writes_pending(
+        self, transcript_store: TranscriptStore, session_id: str
+    ) -> None:
+        """Test that closing a session writes its buffered events.
+
+        Args:
+            transcript_store: The TranscriptStore fixture instance.
+            session_id: The test session ID fixture.
+        """
+        transcript_store.init_session(session_id)
+        await transcript_store.append_lifecycle(session_id, "terminated", {"exitCode": 0})
+        transcript_store.close_session(session_id)
+
+        transcript_path = transcript_store._get_transcript_path(session_id)
+        event = json.loads(transcript_path.read_text(encoding="utf-8"))
+        assert event["event"] == "terminated"
+
+    def test_append_handle_reused_until_close(
+        self, transcript_store: TranscriptStore, session_id: str
+    ) -> None:
+        """Test that one append handle serves a session until it is closed.
+
+        Args:
+            transcript_store: The TranscriptStore fixture instance.
+            session_id: The test session ID fixture.
+        """
+        transcript_store.init_session(session_id)
+        handle = transcript_store._files[session_id]
+        transcript_store.append_output_sync(session_id, "output 1")
+        transcript_store.append_output_sync(session_id, "output 2")
+        assert transcript_store._files[session_id] is handle
+
+        transcript_store.close_session(session_id)
+        assert handle.closed
+        assert session_id not in transcript_store._files
+        assert len(transcript_store.read_all_events(session_id)) == 2
+
+    def test_append_after_close_keeps_no_handle(
+        self, transcript_store: TranscriptStore, session_id: str
+    ) -> None:
+        """Test that events appended after close are written without reopening a handle.
+
+        Args:
+            transcript_store: The TranscriptStore fixture instance.
+            session_id: The test session ID fixture.
+        """
+        transcript_store.init_session(session_id)
+        transcript_store.close_session(session_id)
+        transcript_store.append_lifecycle_sync(session_id, "terminated", {"exitCode": 0})
+
+        assert session_id not in transcript_store._files
+        assert len(transcript_store.read_all_events(session_id)) == 1
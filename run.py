@@ -8,17 +8,107 @@ import sys
 # Add backend to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "backend"))
 
+# Windows Job Object holding this process and every process it spawns
+_job_handle: int | None = None
+
+
+def create_kill_on_close_job() -> int | None:
+    """Place this process in a Job Object that kills its members on close.
+
+    Processes spawned afterwards (copilot.exe under ConPTY) join the job, so
+    when this process exits and the kernel closes the last job handle, all
+    of them are terminated without enumerating the process tree.
+
+    Returns:
+        The job handle, or None if not on Windows or the job couldn't be set up
+    """
+    if sys.platform != "win32":
+        return None
+
+    import ctypes
+    from ctypes import wintypes
+
+    class IoCounters(ctypes.Structure):
+        _fields_ = [
+            ("ReadOperationCount", ctypes.c_ulonglong),
+            ("WriteOperationCount", ctypes.c_ulonglong),
+            ("OtherOperationCount", ctypes.c_ulonglong),
+            ("ReadTransferCount", ctypes.c_ulonglong),
+            ("WriteTransferCount", ctypes.c_ulonglong),
+            ("OtherTransferCount", ctypes.c_ulonglong),
+        ]
+
+    class JobObjectBasicLimitInformation(ctypes.Structure):
+        _fields_ = [
+            ("PerProcessUserTimeLimit", ctypes.c_int64),
+            ("PerJobUserTimeLimit", ctypes.c_int64),
+            ("LimitFlags", wintypes.DWORD),
+            ("MinimumWorkingSetSize", ctypes.c_size_t),
+            ("MaximumWorkingSetSize", ctypes.c_size_t),
+            ("ActiveProcessLimit", wintypes.DWORD),
+            ("Affinity", ctypes.c_size_t),
+            ("PriorityClass", wintypes.DWORD),
+            ("SchedulingClass", wintypes.DWORD),
+        ]
+
+    class JobObjectExtendedLimitInformation(ctypes.Structure):
+        _fields_ = [
+            ("BasicLimitInformation", JobObjectBasicLimitInformation),
+            ("IoInfo", IoCounters),
+            ("ProcessMemoryLimit", ctypes.c_size_t),
+            ("JobMemoryLimit", ctypes.c_size_t),
+            ("PeakProcessMemoryUsed", ctypes.c_size_t),
+            ("PeakJobMemoryUsed", ctypes.c_size_t),
+        ]
+
+    job_object_extended_limit_information = 9
+    job_object_limit_kill_on_job_close = 0x2000
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.CreateJobObjectW.argtypes = [ctypes.c_void_p, wintypes.LPCWSTR]
+    kernel32.CreateJobObjectW.restype = wintypes.HANDLE
+    kernel32.SetInformationJobObject.argtypes = [
+        wintypes.HANDLE, ctypes.c_int, ctypes.c_void_p, wintypes.DWORD
+    ]
+    kernel32.SetInformationJobObject.restype = wintypes.BOOL
+    kernel32.AssignProcessToJobObject.argtypes = [wintypes.HANDLE, wintypes.HANDLE]
+    kernel32.AssignProcessToJobObject.restype = wintypes.BOOL
+    kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+
+    job = kernel32.CreateJobObjectW(None, None)
+    if not job:
+        return None
+
+    info = JobObjectExtendedLimitInformation()
+    info.BasicLimitInformation.LimitFlags = job_object_limit_kill_on_job_close
+    if not kernel32.SetInformationJobObject(
+        job,
+        job_object_extended_limit_information,
+        ctypes.byref(info),
+        ctypes.sizeof(info),
+    ) or not kernel32.AssignProcessToJobObject(job, kernel32.GetCurrentProcess()):
+        kernel32.CloseHandle(job)
+        return None
+
+    return int(job)
+
 
 def kill_copilot_processes() -> None:
     """Kill all copilot.exe child processes spawned by this application.
 
-    Finds all child processes of the current process that have "copilot" in
-    their name and terminates them. First attempts graceful termination,
+    When the kill-on-close Job Object is in place there is nothing to do:
+    the kernel terminates the children as this process exits. Otherwise,
+    finds all child processes of the current process that have "copilot"
+    in their name and terminates them. First attempts graceful termination,
     then force kills any processes that don't exit within 2 seconds.
 
     Returns:
         None
     """
+    if _job_handle is not None:
+        return
+
     try:
         import psutil
     except ImportError:
@@ -66,6 +156,9 @@ def signal_handler(signum: int, frame: object) -> None:
 
 
 if __name__ == "__main__":
+    # Tie child process lifetime to ours where the OS supports it
+    _job_handle = create_kill_on_close_job()
+
     # Register cleanup on normal exit
     atexit.register(kill_copilot_processes)
 